@@ -0,0 +1,28 @@
+"""Shared Rich console for terminal output.
+
+The CLI, setup wizard, validation and report output all print through one
+Console, created on first use so commands that never print don't import Rich.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+_console: Console | None = None
+
+
+def get_console() -> Console:
+    """Get the shared Rich console, creating it on first use.
+
+    Returns:
+        The process-wide Console instance.
+    """
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
@@ -76,6 +76,11 @@ class BaseAPIClient:
     # Override in subclasses: config section name for API key lookup (e.g., "tmdb")
     _config_section: str = ""
 
+    # Connection pool shared by every request on a client. Idle connections are
+    # kept long enough to survive retry_with_backoff sleeps, so retries and the
+    # rest of a scan reuse the open TLS connection instead of reconnecting.
+    _http_limits = httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60.0)
+
     def __init__(self, cache: Cache | None = None) -> None:
         self._cache = cache
         self._client: httpx.Client | None = None
@@ -123,8 +128,13 @@ class BaseAPIClient:
 
     def _handle_response(self, response: httpx.Response) -> dict[str, Any]:
         """Handle API response and raise appropriate errors."""
+        self._raise_for_status(response)
+        return cast(dict[str, Any], response.json())
+
+    def _raise_for_status(self, response: httpx.Response) -> None:
+        """Raise the matching API error for any non-200 response."""
         if response.status_code == 200:
-            return cast(dict[str, Any], response.json())
+            return
 
         if response.status_code == 401:
             self._on_auth_failure()
@@ -3,6 +3,10 @@
 Cache is stored in a single file: `complexionist.cache.json` next to the
 config file or executable for maximum portability.
 
+An opt-in SQLite backend (`SqliteCache`, stored as `complexionist.cache.db`,
+selected with `backend = sqlite` in the [cache] config section) keeps one row
+per entry instead of one JSON document.
+
 File structure:
     {
         "_meta": {
@@ -21,6 +25,7 @@ File structure:
                 "_cache_meta": {
                     "cached_at": "2025-01-25T10:00:00Z",
                     "expires_at": "2025-02-01T10:00:00Z",
+                    "expires_at_epoch": 1738404000.0,
                     "ttl_hours": 168
                 },
                 "data": { ... }
@@ -34,17 +39,34 @@ File structure:
 from __future__ import annotations
 
 import hashlib
+import importlib.util
 import json
 import logging
+import os
 import threading
+import time
+import uuid
 from dataclasses import dataclass, field
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, Self, cast
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+# zstandard and sqlite3 are only needed by opt-in backends, so they are imported
+# on first use rather than on every `import complexionist.cache`
+_HAS_ZSTD = importlib.util.find_spec("zstandard") is not None
 
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    import sqlite3
+
     from complexionist.plex import PlexMovie, PlexShow
 
 # Default TTLs in hours
@@ -56,10 +78,113 @@ TVDB_SERIES_ENDED_TTL_HOURS = 8760  # 365 days (ended shows rarely change)
 TVDB_EPISODES_TTL_HOURS = 24  # 24 hours
 TVDB_EPISODES_ENDED_TTL_HOURS = 8760  # 365 days (ended shows won't get new episodes)
 
+# os.O_BINARY only exists on Windows, where it stops newline translation
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
 # Cache file version for future migrations
 CACHE_VERSION = 1
 
 
+def _json_default(obj: Any) -> str:
+    """Encode the few non-JSON types allowed in cache data.
+
+    Cached payloads are expected to be JSON-native already (callers store
+    `model_dump(mode="json")`). Anything else is a bug, so it raises instead
+    of being silently stringified.
+
+    Raises:
+        TypeError: If the object is not a date, datetime or Path.
+    """
+    if isinstance(obj, date | datetime):
+        return obj.isoformat()
+    if isinstance(obj, Path):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _json_dumps(data: Any) -> bytes:
+    """Serialize cache data to compact JSON bytes (orjson when available).
+
+    The cache file is machine-read, so no indentation: pretty-printing roughly
+    doubles both the file size and the encoding time.
+    """
+    if _HAS_ORJSON:
+        return orjson.dumps(data, default=_json_default)
+    return json.dumps(data, separators=(",", ":"), default=_json_default).encode("utf-8")
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Parse JSON bytes (orjson when available)."""
+    if _HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _zstd_compress(payload: bytes) -> bytes:
+    """Compress a serialized cache payload with zstd (level 3)."""
+    import zstandard
+
+    return cast(bytes, zstandard.ZstdCompressor(level=3).compress(payload))
+
+
+def _zstd_decompress(raw: bytes) -> bytes:
+    """Decompress a zstd cache payload.
+
+    Raises:
+        ValueError: If the payload is not valid zstd data.
+    """
+    import zstandard
+
+    try:
+        return cast(bytes, zstandard.ZstdDecompressor().decompress(raw))
+    except zstandard.ZstdError as e:
+        raise ValueError(str(e)) from e
+
+
+def _is_expired(meta: dict[str, Any], now: float) -> bool:
+    """Check whether an entry's `_cache_meta` says it has expired.
+
+    Prefers the `expires_at_epoch` float written by current versions and falls
+    back to parsing the ISO `expires_at` string for older entries. An entry
+    with an unparseable expiry date is treated as expired.
+
+    Args:
+        meta: The entry's `_cache_meta` dict.
+        now: Current time as a Unix timestamp.
+    """
+    expires_at_epoch = meta.get("expires_at_epoch")
+    if expires_at_epoch is not None:
+        return bool(now > expires_at_epoch)
+
+    expires_at_str = meta.get("expires_at")
+    if not expires_at_str:
+        return False
+    try:
+        return now > datetime.fromisoformat(expires_at_str).timestamp()
+    except ValueError:
+        return True
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Flush a directory entry to disk so a completed rename survives a crash.
+
+    Directories cannot be opened for fsync on Windows; there the rename is
+    already durable once the file handle is flushed, so this is a no-op.
+    """
+    flags = getattr(os, "O_DIRECTORY", None)
+    if flags is None:
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY | flags)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+    except OSError:
+        # Some filesystems refuse directory fsync; the rename itself succeeded
+        logger.debug("Directory fsync failed for %s", directory)
+
+
 @dataclass
 class CacheStats:
     """Statistics about the cache."""
@@ -87,11 +212,19 @@ def get_cache_file_path() -> Path:
     """Get the path to the cache file.
 
     Cache is stored next to the config file for portability.
-    Falls back to exe directory if no config is loaded.
+    Falls back to exe directory if no config is loaded. The
+    `COMPLEXIONIST_CACHE_DIR` environment variable overrides both.
+
+    The result is deliberately not memoized: it follows whichever config
+    file is currently loaded, which can change between calls.
 
     Returns:
         Path to cache file (complexionist.cache.json).
     """
+    override = os.environ.get("COMPLEXIONIST_CACHE_DIR")
+    if override:
+        return Path(override) / "complexionist.cache.json"
+
     from complexionist.config import get_config_path, get_exe_directory
 
     # Try to use config file location
@@ -109,6 +242,21 @@ def get_cache_dir() -> Path:
     return get_cache_file_path().parent
 
 
+def create_cache() -> Cache:
+    """Create the cache backend selected in the [cache] config section.
+
+    Returns:
+        A `SqliteCache` when `backend = sqlite`, otherwise the JSON-file `Cache`
+        with the configured `compress` / `durable` options.
+    """
+    from complexionist.config import get_config
+
+    cache_config = get_config().cache
+    if cache_config.backend == "sqlite":
+        return SqliteCache()
+    return Cache(compress=cache_config.compress, durable=cache_config.durable)
+
+
 @dataclass
 class LibraryFingerprint:
     """Fingerprint of a Plex library for cache invalidation."""
@@ -170,6 +318,8 @@ class Cache:
 
     All cache entries are stored in a single JSON file for portability.
     The file is loaded on first access and saved periodically or on flush.
+    After that first load every lookup is served from the in-memory dict, so
+    repeated reads of the same entry never touch the disk.
 
     To avoid file system contention (especially on Windows), saves are batched:
     - Changes are accumulated in memory
@@ -182,6 +332,8 @@ class Cache:
         cache_dir: Path | None = None,
         enabled: bool = True,
         auto_save_threshold: int = 250,
+        durable: bool = False,
+        compress: bool = False,
     ) -> None:
         """Initialize the cache.
 
@@ -191,20 +343,35 @@ class Cache:
             enabled: Whether caching is enabled. If False, all operations are no-ops.
             auto_save_threshold: Number of changes before auto-saving to disk.
                 Set to 0 to disable auto-save (manual flush only). Default is 250.
+            durable: If True, fsync the cache file and its directory on every save
+                so a crash can't leave a truncated file behind. Off by default
+                since the cache is non-critical and can be rebuilt.
+            compress: If True and the optional `zstandard` package is installed,
+                store the cache zstd-compressed as `complexionist.cache.json.zst`.
+                TMDB payloads are highly repetitive and shrink several-fold.
+                Without `zstandard` the plain JSON file is used.
         """
         self.enabled = enabled
         self.auto_save_threshold = auto_save_threshold
+        self.durable = durable
+        self.compress = compress and _HAS_ZSTD
         if cache_dir is not None:
             self.cache_file = cache_dir / "complexionist.cache.json"
         else:
             self.cache_file = get_cache_file_path()
+        if self.compress:
+            self.cache_file = self.cache_file.with_name(self.cache_file.name + ".zst")
         self.cache_dir = self.cache_file.parent  # For backwards compatibility
         self._data: dict[str, Any] | None = None
         self._dirty_count: int = 0  # Track unsaved changes
         self._lock = threading.RLock()
 
     def _make_key(self, namespace: str, category: str, key: str) -> str:
-        """Make a cache entry key from namespace/category/key."""
+        """Make a cache entry key from namespace/category/key.
+
+        Entries live in one dict keyed by plain strings, so no Path objects
+        are built per lookup - this single f-string is the whole cost.
+        """
         return f"{namespace}/{category}/{key}"
 
     def _load(self) -> dict[str, Any]:
@@ -212,20 +379,23 @@ class Cache:
         if self._data is not None:
             return self._data
 
-        if not self.cache_file.exists():
+        try:
+            with open(self.cache_file, "rb") as f:
+                raw = f.read()
+            if self.compress:
+                raw = _zstd_decompress(raw)
+            self._data = _json_loads(raw)
+            # Ensure required keys exist
+            if "entries" not in self._data:
+                self._data["entries"] = {}
+            if "fingerprints" not in self._data:
+                self._data["fingerprints"] = {}
+            return self._data
+        except FileNotFoundError:
+            # No cache yet - a single failed open() replaces exists() + open()
             self._data = self._empty_cache()
             return self._data
-
-        try:
-            with open(self.cache_file, encoding="utf-8") as f:
-                self._data = json.load(f)
-                # Ensure required keys exist
-                if "entries" not in self._data:
-                    self._data["entries"] = {}
-                if "fingerprints" not in self._data:
-                    self._data["fingerprints"] = {}
-                return self._data
-        except (json.JSONDecodeError, OSError):
+        except (ValueError, OSError):
             # Corrupted file - start fresh
             self._data = self._empty_cache()
             return self._data
@@ -247,6 +417,8 @@ class Cache:
         Writes to a temporary file first, then renames it to the target.
         This prevents corruption if the process is interrupted mid-write.
         Falls back to direct write if rename fails (e.g., cross-device).
+        With `durable` set, the temp file is fsynced before the rename and the
+        directory afterwards (write -> fsync -> rename -> fsync dir).
         """
         if self._data is None:
             return
@@ -254,16 +426,33 @@ class Cache:
         # Ensure parent directory exists
         self.cache_file.parent.mkdir(parents=True, exist_ok=True)
 
-        tmp_file = self.cache_file.with_suffix(".tmp")
         try:
-            with open(tmp_file, "w", encoding="utf-8") as f:
-                json.dump(self._data, f, indent=2, default=str)
+            payload = _json_dumps(self._data)
+            if self.compress:
+                payload = _zstd_compress(payload)
+        except (TypeError, ValueError) as e:
+            logger.warning("Cache not saved, data is not serializable: %s", e)
+            return  # Cache is non-critical
+        # Unique name in the same directory: the rename stays on one filesystem,
+        # and O_EXCL means two writers can never share a temp file
+        tmp_file = self.cache_file.parent / (
+            f".{self.cache_file.name}.{os.getpid()}.{uuid.uuid4().hex}.tmp"
+        )
+        try:
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL | _O_BINARY, 0o644)
+            with open(fd, "wb") as f:
+                f.write(payload)
+                if self.durable:
+                    f.flush()
+                    os.fsync(f.fileno())
             tmp_file.replace(self.cache_file)
+            if self.durable:
+                _fsync_directory(self.cache_file.parent)
         except OSError:
             # Fallback: direct write (e.g., rename failed on Windows with open handles)
             try:
-                with open(self.cache_file, "w", encoding="utf-8") as f:
-                    json.dump(self._data, f, indent=2, default=str)
+                with open(self.cache_file, "wb") as f:
+                    f.write(payload)
             except OSError:
                 logger.debug("Cache write failed for %s", self.cache_file)
                 return  # Cache is non-critical
@@ -293,6 +482,19 @@ class Cache:
             if self._dirty_count > 0:
                 self._save()
 
+    def close(self) -> None:
+        """Flush pending changes and release any open resources.
+
+        The JSON cache holds no open handles, so this is just a flush.
+        """
+        self.flush()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
     @property
     def pending_changes(self) -> int:
         """Number of changes pending save."""
@@ -320,23 +522,11 @@ class Cache:
             if entry is None:
                 return None
 
-            # Check expiration
-            meta = entry.get("_cache_meta", {})
-            expires_at_str = meta.get("expires_at")
-
-            if expires_at_str:
-                try:
-                    expires_at = datetime.fromisoformat(expires_at_str)
-                    if datetime.now(UTC) > expires_at:
-                        # Expired - remove and return None
-                        del data["entries"][cache_key]
-                        self._mark_dirty()
-                        return None
-                except ValueError:
-                    # Invalid date - remove entry
-                    del data["entries"][cache_key]
-                    self._mark_dirty()
-                    return None
+            # Check expiration (invalid dates count as expired)
+            if _is_expired(entry.get("_cache_meta", {}), time.time()):
+                del data["entries"][cache_key]
+                self._mark_dirty()
+                return None
 
             return cast(dict[str, Any] | None, entry.get("data"))
 
@@ -355,13 +545,21 @@ class Cache:
             namespace: Top-level namespace (e.g., "tmdb", "tvdb").
             category: Category within namespace (e.g., "movies", "collections").
             key: Unique key for the entry.
-            data: Data to cache.
+            data: JSON-native data to cache, e.g. `model.model_dump(mode="json")`.
             ttl_hours: Time-to-live in hours.
             description: Human-readable description (not stored in single-file mode).
         """
         if not self.enabled:
             return
 
+        # Reject an entry the encoder can't handle here, so it never reaches
+        # _save() and blocks every later write of the whole file
+        try:
+            _json_dumps(data)
+        except (TypeError, ValueError) as e:
+            logger.warning("Cache entry %s/%s/%s not stored: %s", namespace, category, key, e)
+            return  # Cache is non-critical
+
         with self._lock:
             cache_data = self._load()
             cache_key = self._make_key(namespace, category, key)
@@ -373,6 +571,7 @@ class Cache:
                 "_cache_meta": {
                     "cached_at": now.isoformat(),
                     "expires_at": expires_at.isoformat(),
+                    "expires_at_epoch": expires_at.timestamp(),
                     "ttl_hours": ttl_hours,
                 },
                 "data": data,
@@ -446,53 +645,58 @@ class Cache:
         data = self._load()
         entries = data.get("entries", {})
 
-        tmdb_movies = 0
-        tmdb_collections = 0
-        tvdb_episodes = 0
-        oldest: datetime | None = None
-        newest: datetime | None = None
+        # Dict dispatch on (namespace, category) instead of a branch ladder
+        counts: dict[tuple[str, str], int] = {
+            ("tmdb", "movies"): 0,
+            ("tmdb", "collections"): 0,
+            ("tvdb", "episodes"): 0,
+        }
+        cached_times: list[datetime] = []
 
         for cache_key, entry in entries.items():
-            # Count by category
-            parts = cache_key.split("/")
+            # Count by category (only the first two segments matter)
+            parts = cache_key.split("/", 2)
             if len(parts) >= 2:
-                namespace, category = parts[0], parts[1]
-                if namespace == "tmdb":
-                    if category == "movies":
-                        tmdb_movies += 1
-                    elif category == "collections":
-                        tmdb_collections += 1
-                elif namespace == "tvdb":
-                    if category == "episodes":
-                        tvdb_episodes += 1
-
-            # Track oldest/newest
+                bucket = (parts[0], parts[1])
+                if bucket in counts:
+                    counts[bucket] += 1
+
             cached_at_str = entry.get("_cache_meta", {}).get("cached_at")
             if cached_at_str:
                 try:
-                    cached_at = datetime.fromisoformat(cached_at_str)
-                    if oldest is None or cached_at < oldest:
-                        oldest = cached_at
-                    if newest is None or cached_at > newest:
-                        newest = cached_at
+                    cached_times.append(datetime.fromisoformat(cached_at_str))
                 except ValueError:
                     continue
 
-        # Get file size
-        total_size = 0
-        if self.cache_file.exists():
+        # Get file size (single stat; a missing file simply means size 0)
+        try:
             total_size = self.cache_file.stat().st_size
+        except OSError:
+            total_size = 0
 
         return CacheStats(
             total_entries=len(entries),
             total_size_bytes=total_size,
-            tmdb_movies=tmdb_movies,
-            tmdb_collections=tmdb_collections,
-            tvdb_episodes=tvdb_episodes,
-            oldest_entry=oldest,
-            newest_entry=newest,
+            tmdb_movies=counts[("tmdb", "movies")],
+            tmdb_collections=counts[("tmdb", "collections")],
+            tvdb_episodes=counts[("tvdb", "episodes")],
+            oldest_entry=min(cached_times, default=None),
+            newest_entry=max(cached_times, default=None),
         )
 
+    def _expired_keys_unlocked(self) -> list[str]:
+        """Collect keys of expired entries (caller must hold lock).
+
+        Entries with an unparseable expiry date are treated as expired.
+        """
+        entries = self._load().get("entries", {})
+        now = time.time()
+        return [
+            cache_key
+            for cache_key, entry in entries.items()
+            if _is_expired(entry.get("_cache_meta", {}), now)
+        ]
+
     def get_expired_count(self) -> int:
         """Count expired entries that haven't been cleaned up yet.
 
@@ -500,21 +704,7 @@ class Cache:
             Number of expired entries.
         """
         with self._lock:
-            data = self._load()
-            count = 0
-            now = datetime.now(UTC)
-
-            for entry in data.get("entries", {}).values():
-                expires_at_str = entry.get("_cache_meta", {}).get("expires_at")
-                if expires_at_str:
-                    try:
-                        expires_at = datetime.fromisoformat(expires_at_str)
-                        if now > expires_at:
-                            count += 1
-                    except ValueError:
-                        count += 1  # Invalid date counts as expired
-
-            return count
+            return len(self._expired_keys_unlocked())
 
     def cleanup_expired(self) -> int:
         """Remove all expired entries.
@@ -523,22 +713,11 @@ class Cache:
             Number of entries removed.
         """
         with self._lock:
-            data = self._load()
-            now = datetime.now(UTC)
-            keys_to_delete = []
-
-            for cache_key, entry in data.get("entries", {}).items():
-                expires_at_str = entry.get("_cache_meta", {}).get("expires_at")
-                if expires_at_str:
-                    try:
-                        expires_at = datetime.fromisoformat(expires_at_str)
-                        if now > expires_at:
-                            keys_to_delete.append(cache_key)
-                    except ValueError:
-                        keys_to_delete.append(cache_key)
+            keys_to_delete = self._expired_keys_unlocked()
+            entries = self._load()["entries"]
 
             for key in keys_to_delete:
-                del data["entries"][key]
+                del entries[key]
 
             if keys_to_delete:
                 self._save()
@@ -632,3 +811,267 @@ class Cache:
             self._save()
 
             return count
+
+
+class SqliteCache(Cache):
+    """SQLite-backed variant of the API response cache.
+
+    Stores each entry as a row in `complexionist.cache.db` (next to where the
+    JSON cache would live) instead of rewriting one large JSON file on every
+    save. Lookups are indexed, expiry cleanup is a single DELETE, and writes
+    are committed in batches using the same `auto_save_threshold` / `flush()`
+    semantics as the JSON cache.
+
+    The JSON-file `Cache` remains the default; set `backend = sqlite` in the
+    [cache] config section to use this one (see `create_cache`).
+    """
+
+    DB_FILENAME = "complexionist.cache.db"
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        enabled: bool = True,
+        auto_save_threshold: int = 250,
+    ) -> None:
+        """Initialize the SQLite cache.
+
+        Args:
+            cache_dir: Custom cache directory (database will be placed here).
+                Defaults to same directory as config file.
+            enabled: Whether caching is enabled. If False, all operations are no-ops.
+            auto_save_threshold: Number of changes before committing to disk.
+                Set to 0 to commit only on flush. Default is 250.
+        """
+        super().__init__(
+            cache_dir=cache_dir, enabled=enabled, auto_save_threshold=auto_save_threshold
+        )
+        self.cache_file = self.cache_dir / self.DB_FILENAME
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use and ensure the schema exists."""
+        if self._conn is not None:
+            return self._conn
+
+        import sqlite3
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.cache_file, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " namespace TEXT NOT NULL,"
+            " category TEXT NOT NULL,"
+            " key TEXT NOT NULL,"
+            " cached_at REAL NOT NULL,"
+            " expires_at REAL NOT NULL,"
+            " ttl_hours INTEGER NOT NULL,"
+            " data BLOB NOT NULL,"
+            " PRIMARY KEY (namespace, category, key))"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_expires ON entries (expires_at)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS fingerprints (library_name TEXT PRIMARY KEY, data TEXT)"
+        )
+        conn.commit()
+        self._conn = conn
+        return conn
+
+    def _save(self) -> None:
+        """Commit pending writes."""
+        if self._conn is None:
+            return
+        import sqlite3
+
+        try:
+            self._conn.commit()
+        except sqlite3.Error:
+            logger.debug("Cache commit failed for %s", self.cache_file)
+            return  # Cache is non-critical
+        self._dirty_count = 0
+
+    def close(self) -> None:
+        """Commit pending writes and close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._save()
+                self._conn.close()
+                self._conn = None
+
+    def get(self, namespace: str, category: str, key: str) -> dict[str, Any] | None:
+        """Get a cached entry if it exists and hasn't expired."""
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT expires_at, data FROM entries"
+                " WHERE namespace = ? AND category = ? AND key = ?",
+                (namespace, category, key),
+            ).fetchone()
+            if row is None:
+                return None
+
+            expires_at, raw = row
+            if expires_at < time.time():
+                conn.execute(
+                    "DELETE FROM entries WHERE namespace = ? AND category = ? AND key = ?",
+                    (namespace, category, key),
+                )
+                self._mark_dirty()
+                return None
+
+            return cast(dict[str, Any], _json_loads(raw))
+
+    def set(
+        self,
+        namespace: str,
+        category: str,
+        key: str,
+        data: dict[str, Any],
+        ttl_hours: int,
+        description: str = "",
+    ) -> None:
+        """Store data in the cache."""
+        if not self.enabled:
+            return
+
+        try:
+            payload = _json_dumps(data)
+        except (TypeError, ValueError) as e:
+            logger.warning("Cache entry %s/%s/%s not stored: %s", namespace, category, key, e)
+            return  # Cache is non-critical
+
+        with self._lock:
+            now = time.time()
+            self._connect().execute(
+                "INSERT OR REPLACE INTO entries"
+                " (namespace, category, key, cached_at, expires_at, ttl_hours, data)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    namespace,
+                    category,
+                    key,
+                    now,
+                    now + ttl_hours * 3600,
+                    ttl_hours,
+                    payload,
+                ),
+            )
+            self._mark_dirty()
+
+    def delete(self, namespace: str, category: str, key: str) -> bool:
+        """Delete a specific cache entry."""
+        with self._lock:
+            cursor = self._connect().execute(
+                "DELETE FROM entries WHERE namespace = ? AND category = ? AND key = ?",
+                (namespace, category, key),
+            )
+            if cursor.rowcount > 0:
+                self._mark_dirty()
+                return True
+            return False
+
+    def clear(self, namespace: str | None = None) -> int:
+        """Clear cache entries, optionally only within one namespace."""
+        with self._lock:
+            conn = self._connect()
+            if namespace:
+                cursor = conn.execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+            else:
+                cursor = conn.execute("DELETE FROM entries")
+            self._save()
+            return cursor.rowcount
+
+    def _stats_unlocked(self) -> CacheStats:
+        """Internal stats implementation (caller must hold lock)."""
+        conn = self._connect()
+        counts: dict[tuple[str, str], int] = {
+            (namespace, category): count
+            for namespace, category, count in conn.execute(
+                "SELECT namespace, category, COUNT(*) FROM entries GROUP BY namespace, category"
+            )
+        }
+        total, oldest, newest = conn.execute(
+            "SELECT COUNT(*), MIN(cached_at), MAX(cached_at) FROM entries"
+        ).fetchone()
+
+        # In WAL mode recent commits live in the -wal file until checkpointed
+        total_size = 0
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                total_size += os.stat(f"{self.cache_file}{suffix}").st_size
+            except OSError:
+                pass
+
+        return CacheStats(
+            total_entries=total,
+            total_size_bytes=total_size,
+            tmdb_movies=counts.get(("tmdb", "movies"), 0),
+            tmdb_collections=counts.get(("tmdb", "collections"), 0),
+            tvdb_episodes=counts.get(("tvdb", "episodes"), 0),
+            oldest_entry=datetime.fromtimestamp(oldest, UTC) if oldest is not None else None,
+            newest_entry=datetime.fromtimestamp(newest, UTC) if newest is not None else None,
+        )
+
+    def get_expired_count(self) -> int:
+        """Count expired entries that haven't been cleaned up yet."""
+        with self._lock:
+            row = (
+                self._connect()
+                .execute("SELECT COUNT(*) FROM entries WHERE expires_at < ?", (time.time(),))
+                .fetchone()
+            )
+            return int(row[0])
+
+    def cleanup_expired(self) -> int:
+        """Remove all expired entries."""
+        with self._lock:
+            cursor = self._connect().execute(
+                "DELETE FROM entries WHERE expires_at < ?", (time.time(),)
+            )
+            if cursor.rowcount > 0:
+                self._save()
+            return cursor.rowcount
+
+    def get_library_fingerprint(self, library_name: str) -> LibraryFingerprint | None:
+        """Get the stored fingerprint for a library."""
+        with self._lock:
+            row = (
+                self._connect()
+                .execute("SELECT data FROM fingerprints WHERE library_name = ?", (library_name,))
+                .fetchone()
+            )
+            if row is None:
+                return None
+            return LibraryFingerprint.from_dict(_json_loads(row[0]))
+
+    def set_library_fingerprint(self, library_name: str, fingerprint: LibraryFingerprint) -> None:
+        """Store the fingerprint for a library."""
+        with self._lock:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO fingerprints (library_name, data) VALUES (?, ?)",
+                (library_name, _json_dumps(fingerprint.to_dict()).decode("utf-8")),
+            )
+            self._mark_dirty()
+
+    def invalidate_library(self, library_name: str) -> int:
+        """Remove a library's fingerprint and clear all cache entries."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM fingerprints WHERE library_name = ?", (library_name,))
+            count = conn.execute("DELETE FROM entries").rowcount
+            self._save()
+            return count
+
+    def refresh(self) -> int:
+        """Force refresh - clear all cache and fingerprints."""
+        with self._lock:
+            conn = self._connect()
+            count = conn.execute("DELETE FROM entries").rowcount
+            conn.execute("DELETE FROM fingerprints")
+            self._save()
+            return count
@@ -3,29 +3,41 @@
 from __future__ import annotations
 
 import sys
+import time
 from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import click
 
-# Minimal Rich imports for immediate banner display
-# Heavy modules (pydantic, httpx, plexapi) are loaded lazily after banner shows
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-
 from complexionist import __version__
+from complexionist._console import get_console
 from complexionist.constants import PLEX_YELLOW
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.progress import Progress
+
+
+# Rich is imported on first console use (get_console()), so GUI launches,
+# --version and shell completion never load it. Heavy modules (pydantic, httpx,
+# plexapi) are loaded lazily after banner shows
 
 # Track if heavy modules have been loaded
 _modules_loaded = False
 
+# Minimum seconds between progress bar updates (caps terminal redraws at ~10/s)
+_PROGRESS_MIN_INTERVAL = 0.1
+
 
 def _show_splash() -> None:
     """Display the application splash banner."""
+    from rich.panel import Panel
+    from rich.text import Text
+
+    console = get_console()
+
     # ASCII art banner (no trailing whitespace)
     banner = r"""
    _____                _____  _           _             _     _
@@ -71,7 +83,7 @@ def _load_modules() -> None:
 
     from rich.status import Status
 
-    with Status("[dim]Starting up...[/dim]", console=console, spinner="dots"):
+    with Status("[dim]Starting up...[/dim]", console=get_console(), spinner="dots"):
         # Import heavy modules to warm them up
         # These imports trigger pydantic model compilation, httpx setup, etc.
         from complexionist import config, output, plex, tmdb, tvdb  # noqa: F401
@@ -84,6 +96,7 @@ class BannerGroup(click.Group):
 
     def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
         """Show banner before help text."""
+        console = get_console()
         _show_splash()
         console.print()
         super().format_help(ctx, formatter)
@@ -94,6 +107,7 @@ class BannerCommand(click.Command):
 
     def format_help(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
         """Show banner before help text."""
+        console = get_console()
         _show_splash()
         console.print()
         super().format_help(ctx, formatter)
@@ -101,6 +115,7 @@ class BannerCommand(click.Command):
 
 def _show_help_hints() -> None:
     """Display helpful hints for getting started."""
+    console = get_console()
     console.print()
     console.print("[bold]Quick Start:[/bold]")
     console.print(
@@ -132,6 +147,7 @@ def _run_interactive_start(ctx: click.Context) -> None:
     """Run interactive mode selection when config is valid."""
     from rich.prompt import Prompt
 
+    console = get_console()
     console.print()
     console.print("[bold]What would you like to scan?[/bold]")
     console.print()
@@ -170,6 +186,8 @@ def _handle_no_args(ctx: click.Context) -> None:
 
     from complexionist.setup import detect_first_run, run_setup_wizard
 
+    console = get_console()
+
     # Always show splash banner
     _show_splash()
 
@@ -287,6 +305,7 @@ def _resolve_server(server: str | None) -> tuple[str | None, str | None]:
     Returns:
         Tuple of (url, token) or (None, None) for default.
     """
+    console = get_console()
     if server is None:
         return None, None
 
@@ -346,6 +365,7 @@ def _list_libraries(libraries: list[Any], lib_type: str) -> None:
     """
     from rich.table import Table
 
+    console = get_console()
     console.print(f"[bold]Available {lib_type} libraries:[/bold]")
     console.print()
 
@@ -363,24 +383,64 @@ def _list_libraries(libraries: list[Any], lib_type: str) -> None:
     console.print('[dim]Example: complexionist movies --library "Movies"[/dim]')
 
 
-def _create_progress_updater(
-    progress_ctx: Any, progress_task: Any
-) -> Callable[[str, int, int], None]:
-    """Create a progress callback function for gap finders.
+def _create_progress() -> Progress:
+    """Create the Rich progress display used while scanning a library.
 
-    Args:
-        progress_ctx: Rich Progress context.
-        progress_task: Progress task ID.
+    Shared by the movies and tv commands. A fresh display is needed per
+    library because the summary shown after each scan may prompt the user,
+    which can't happen while a live display is running.
 
     Returns:
-        Callback function with signature (stage: str, current: int, total: int).
+        Progress instance (use as a context manager).
     """
+    from rich.progress import (
+        BarColumn,
+        Progress,
+        SpinnerColumn,
+        TaskProgressColumn,
+        TextColumn,
+    )
+
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        console=get_console(),
+        transient=False,
+        refresh_per_second=10,
+    )
+
 
-    def callback(stage: str, current: int, total: int) -> None:
-        if progress_ctx is not None and progress_task is not None:
-            progress_ctx.update(progress_task, description=stage, completed=current, total=total)
+@dataclass(slots=True)
+class _ProgressUpdater:
+    """Progress callback for gap finders, forwarding to a Rich progress bar.
 
-    return callback
+    Instances are called as (stage: str, current: int, total: int). Updates
+    are throttled to one every `min_interval` seconds, since gap finders
+    report every item and large libraries would otherwise flood the terminal.
+    Stage changes and the final item of a stage always go through.
+    """
+
+    progress: Any  # Rich Progress context
+    task: Any  # Progress task ID
+    min_interval: float = _PROGRESS_MIN_INTERVAL
+    last_update: float = 0.0
+    last_stage: str | None = None
+
+    def __call__(self, stage: str, current: int, total: int) -> None:
+        if self.progress is None or self.task is None:
+            return
+        now = time.monotonic()
+        if (
+            stage == self.last_stage
+            and current < total
+            and now - self.last_update < self.min_interval
+        ):
+            return
+        self.last_update = now
+        self.last_stage = stage
+        self.progress.update(self.task, description=stage, completed=current, total=total)
 
 
 def _select_library_interactive(libraries: list[Any], lib_type: str) -> str | None:
@@ -395,6 +455,7 @@ def _select_library_interactive(libraries: list[Any], lib_type: str) -> str | No
     """
     from rich.prompt import Prompt
 
+    console = get_console()
     console.print(f"[bold]Multiple {lib_type} libraries found. Please select one:[/bold]")
     console.print()
 
@@ -422,6 +483,65 @@ def _select_library_interactive(libraries: list[Any], lib_type: str) -> str | No
             console.print("[red]Please enter a valid number or library name[/red]")
 
 
+def _get_cache(ctx: click.Context) -> Any:
+    """Get the API response cache for this invocation.
+
+    The cache is kept on the Click context so `scan` loads the cache file
+    once and both commands share its in-memory entries.
+
+    Args:
+        ctx: Click context.
+
+    Returns:
+        Cache instance.
+    """
+    cache = ctx.obj.get("_cache")
+    if cache is None:
+        from complexionist.cache import create_cache
+
+        cache = create_cache()
+        ctx.obj["_cache"] = cache
+        # Close once the whole invocation ends, after scan has run both commands
+        ctx.find_root().call_on_close(cache.close)
+    return cache
+
+
+def _connect_plex(ctx: click.Context, server: str | None) -> Any:
+    """Connect to the selected Plex server, exiting on failure.
+
+    The connected client is kept on the Click context so `scan`, which runs
+    both the movies and tv commands, connects and lists libraries only once.
+
+    Args:
+        ctx: Click context.
+        server: Server name or index from --server (None for default).
+
+    Returns:
+        Connected PlexClient instance.
+    """
+    from complexionist.plex import PlexClient, PlexError
+
+    console = get_console()
+    server_url, server_token = _resolve_server(server)
+    clients: dict[tuple[str | None, str | None], Any] = ctx.obj.setdefault("_plex_clients", {})
+    plex = clients.get((server_url, server_token))
+    if plex is not None:
+        return plex
+
+    try:
+        if server_url and server_token:
+            plex = PlexClient(url=server_url, token=server_token)
+        else:
+            plex = PlexClient()
+        plex.connect()
+    except PlexError as e:
+        console.print(f"[red]Plex error:[/red] {e}")
+        sys.exit(1)
+
+    clients[(server_url, server_token)] = plex
+    return plex
+
+
 def _resolve_libraries(
     plex_client: Any,
     requested: tuple[str, ...],
@@ -439,6 +559,7 @@ def _resolve_libraries(
     Returns:
         List of library names to scan, or None if should exit (listed libraries).
     """
+    console = get_console()
     available = get_libraries_fn()
 
     if not available:
@@ -457,19 +578,16 @@ def _resolve_libraries(
                 return None
             return [selected]
 
-    # Validate requested libraries
+    # Validate requested libraries (stop at the first unknown name)
     available_names = {lib.title for lib in available}
-    library_names = []
-
-    for name in requested:
-        if name not in available_names:
-            console.print(f"[red]Library not found:[/red] {name}")
-            console.print()
-            _list_libraries(available, lib_type)
-            return None
-        library_names.append(name)
+    unknown = next((name for name in requested if name not in available_names), None)
+    if unknown is not None:
+        console.print(f"[red]Library not found:[/red] {unknown}")
+        console.print()
+        _list_libraries(available, lib_type)
+        return None
 
-    return library_names
+    return list(requested)
 
 
 @click.group(cls=BannerGroup, invoke_without_command=True)
@@ -488,6 +606,9 @@ def main(ctx: click.Context, verbose: bool, quiet: bool, cli: bool, gui: bool, w
     ctx.ensure_object(dict)
     ctx.obj["verbose"] = verbose
     ctx.obj["quiet"] = quiet
+    # Fixed once per run so scan's movie and TV CSVs share a directory and date
+    ctx.obj["output_dir"] = Path.cwd()
+    ctx.obj["run_date"] = date.today()
 
     # If a subcommand is invoked, let it handle itself (CLI mode)
     if ctx.invoked_subcommand is not None:
@@ -569,6 +690,7 @@ def movies(
 
     If no --library is specified, lists available movie libraries.
     """
+    console = get_console()
     # Show splash banner immediately (unless called from scan command)
     if not ctx.obj.get("_skip_splash"):
         _show_splash()
@@ -576,11 +698,9 @@ def movies(
         _load_modules()
 
     # Now import the modules we need (they're already loaded/cached)
-    from complexionist.cache import Cache
     from complexionist.config import get_config
     from complexionist.gaps import MovieGapFinder
     from complexionist.output import MovieReportFormatter
-    from complexionist.plex import PlexClient, PlexError
     from complexionist.statistics import ScanStatistics
     from complexionist.tmdb import TMDBClient, TMDBError
 
@@ -603,21 +723,12 @@ def movies(
     if min_owned is None:
         min_owned = cfg.options.min_owned
 
-    # Create cache
-    cache = Cache()
+    # Create cache (shared with the other command when run via scan)
+    cache = _get_cache(ctx)
 
     try:
         # Resolve server and connect to Plex
-        server_url, server_token = _resolve_server(server)
-        try:
-            if server_url and server_token:
-                plex = PlexClient(url=server_url, token=server_token)
-            else:
-                plex = PlexClient()
-            plex.connect()
-        except PlexError as e:
-            console.print(f"[red]Plex error:[/red] {e}")
-            sys.exit(1)
+        plex = _connect_plex(ctx, server)
 
         # Resolve library names
         library_names = _resolve_libraries(plex, library, plex.get_movie_libraries, "movie")
@@ -659,24 +770,9 @@ def movies(
                 report = finder.find_gaps(lib_name)
             else:
                 # Normal mode with progress
-                from rich.progress import (
-                    BarColumn,
-                    Progress,
-                    SpinnerColumn,
-                    TaskProgressColumn,
-                    TextColumn,
-                )
-
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    BarColumn(),
-                    TaskProgressColumn(),
-                    console=console,
-                    transient=False,
-                ) as progress:
+                with _create_progress() as progress:
                     task = progress.add_task("Scanning...", total=None)
-                    progress_callback = _create_progress_updater(progress, task)
+                    progress_callback = _ProgressUpdater(progress, task)
 
                     # Find gaps
                     finder = MovieGapFinder(
@@ -698,14 +794,17 @@ def movies(
             # Output results using formatter
             formatter = MovieReportFormatter(report)
             if format == "json":
-                console.print_json(formatter.to_json())
+                # Indented for people, compact when piped to a file or jq
+                click.echo(formatter.to_json(compact=not sys.stdout.isatty()))
             elif format == "csv":
-                console.print(formatter.to_csv())
+                # Stream straight to stdout (bypasses Rich markup parsing); stdout
+                # is text mode, so write "\n" and let it apply the platform ending
+                formatter.write_csv(sys.stdout, lineterminator="\n")
             else:
                 # Save CSV first (unless --no-csv)
                 csv_path = None
                 if not no_csv and report.collections_with_gaps:
-                    csv_path = formatter.save_csv()
+                    csv_path = formatter.save_csv(ctx.obj["output_dir"], ctx.obj["run_date"])
 
                 # Show summary with option to view details
                 formatter.show_summary(stats, csv_path)
@@ -786,6 +885,7 @@ def tv(
 
     If no --library is specified, lists available TV libraries.
     """
+    console = get_console()
     # Show splash banner immediately (unless called from scan command)
     if not ctx.obj.get("_skip_splash"):
         _show_splash()
@@ -793,11 +893,9 @@ def tv(
         _load_modules()
 
     # Now import the modules we need (they're already loaded/cached)
-    from complexionist.cache import Cache
     from complexionist.config import get_config
     from complexionist.gaps import EpisodeGapFinder
     from complexionist.output import TVReportFormatter
-    from complexionist.plex import PlexClient, PlexError
     from complexionist.statistics import ScanStatistics
     from complexionist.tvdb import TVDBClient, TVDBError
 
@@ -819,23 +917,14 @@ def tv(
         recent_threshold = cfg.options.recent_threshold_hours
 
     # Combine CLI exclusions with config exclusions
-    excluded_shows = list(exclude_show) + cfg.exclusions.shows
+    excluded_shows = [*exclude_show, *cfg.exclusions.shows]
 
-    # Create cache
-    cache = Cache()
+    # Create cache (shared with the other command when run via scan)
+    cache = _get_cache(ctx)
 
     try:
         # Resolve server and connect to Plex
-        server_url, server_token = _resolve_server(server)
-        try:
-            if server_url and server_token:
-                plex = PlexClient(url=server_url, token=server_token)
-            else:
-                plex = PlexClient()
-            plex.connect()
-        except PlexError as e:
-            console.print(f"[red]Plex error:[/red] {e}")
-            sys.exit(1)
+        plex = _connect_plex(ctx, server)
 
         # Resolve library names
         library_names = _resolve_libraries(plex, library, plex.get_tv_libraries, "TV")
@@ -877,24 +966,9 @@ def tv(
                 report = finder.find_gaps(lib_name)
             else:
                 # Normal mode with progress
-                from rich.progress import (
-                    BarColumn,
-                    Progress,
-                    SpinnerColumn,
-                    TaskProgressColumn,
-                    TextColumn,
-                )
-
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[progress.description]{task.description}"),
-                    BarColumn(),
-                    TaskProgressColumn(),
-                    console=console,
-                    transient=False,
-                ) as progress:
+                with _create_progress() as progress:
                     task = progress.add_task("Scanning...", total=None)
-                    progress_callback = _create_progress_updater(progress, task)
+                    progress_callback = _ProgressUpdater(progress, task)
 
                     # Find gaps
                     finder = EpisodeGapFinder(
@@ -916,14 +990,17 @@ def tv(
             # Output results using formatter
             formatter = TVReportFormatter(report)
             if format == "json":
-                console.print_json(formatter.to_json())
+                # Indented for people, compact when piped to a file or jq
+                click.echo(formatter.to_json(compact=not sys.stdout.isatty()))
             elif format == "csv":
-                console.print(formatter.to_csv())
+                # Stream straight to stdout (bypasses Rich markup parsing); stdout
+                # is text mode, so write "\n" and let it apply the platform ending
+                formatter.write_csv(sys.stdout, lineterminator="\n")
             else:
                 # Save CSV first (unless --no-csv)
                 csv_path = None
                 if not no_csv and report.shows_with_gaps:
-                    csv_path = formatter.save_csv()
+                    csv_path = formatter.save_csv(ctx.obj["output_dir"], ctx.obj["run_date"])
 
                 # Show summary with option to view details
                 formatter.show_summary(stats, csv_path)
@@ -977,6 +1054,7 @@ def scan(
 
     If no --library is specified, lists available libraries for each type.
     """
+    console = get_console()
     # Show splash banner immediately
     _show_splash()
 
@@ -1030,6 +1108,7 @@ def config_show() -> None:
     from complexionist.cache import get_cache_file_path
     from complexionist.config import find_config_file, get_config
 
+    console = get_console()
     cfg = get_config()
     config_file = find_config_file()
     cache_file = get_cache_file_path()
@@ -1087,6 +1166,7 @@ def config_path() -> None:
     from complexionist.cache import get_cache_file_path
     from complexionist.config import find_config_file, get_config_paths
 
+    console = get_console()
     console.print("[bold]Configuration paths (in priority order):[/bold]")
     config_file = find_config_file()
 
@@ -1114,6 +1194,7 @@ def config_init(force: bool) -> None:
 
     from complexionist.config import save_default_config
 
+    console = get_console()
     # Save in current directory for portability
     config_path = Path.cwd() / "complexionist.ini"
 
@@ -1155,10 +1236,11 @@ def cache() -> None:
 @click.confirmation_option(prompt="Are you sure you want to clear the cache?")
 def cache_clear() -> None:
     """Clear all cached API responses."""
-    from complexionist.cache import Cache
+    from complexionist.cache import create_cache
 
-    cache = Cache()
-    count = cache.clear()
+    console = get_console()
+    with create_cache() as cache:
+        count = cache.clear()
 
     if count == 0:
         console.print("[dim]Cache is already empty.[/dim]")
@@ -1169,44 +1251,45 @@ def cache_clear() -> None:
 @cache.command(name="stats")
 def cache_stats() -> None:
     """Show cache statistics."""
-    from complexionist.cache import Cache
+    from complexionist.cache import create_cache
 
-    cache = Cache()
-    stats = cache.stats()
+    console = get_console()
+    with create_cache() as cache:
+        stats = cache.stats()
+        expired = cache.get_expired_count()
 
-    console.print("[bold]Cache Statistics[/bold]")
-    console.print()
+    # Collect lines and print once; each console.print is a full render pass
+    lines = ["[bold]Cache Statistics[/bold]", ""]
 
     if stats.total_entries == 0:
-        console.print("[dim]Cache is empty.[/dim]")
-        console.print()
-        console.print(f"Cache location: {cache.cache_dir}")
+        lines += ["[dim]Cache is empty.[/dim]", "", f"Cache location: {cache.cache_dir}"]
+        console.print("\n".join(lines))
         return
 
-    console.print(f"[bold]Total entries:[/bold] {stats.total_entries}")
-    console.print(f"[bold]Total size:[/bold] {stats.total_size_kb:.1f} KB")
-    console.print()
-
-    console.print("[bold]By category:[/bold]")
-    console.print(f"  TMDB movies:      {stats.tmdb_movies}")
-    console.print(f"  TMDB collections: {stats.tmdb_collections}")
-    console.print(f"  TVDB episodes:    {stats.tvdb_episodes}")
-    console.print()
+    lines += [
+        f"[bold]Total entries:[/bold] {stats.total_entries}",
+        f"[bold]Total size:[/bold] {stats.total_size_kb:.1f} KB",
+        "",
+        "[bold]By category:[/bold]",
+        f"  TMDB movies:      {stats.tmdb_movies}",
+        f"  TMDB collections: {stats.tmdb_collections}",
+        f"  TVDB episodes:    {stats.tvdb_episodes}",
+        "",
+    ]
 
     if stats.oldest_entry:
-        console.print(f"[bold]Oldest entry:[/bold] {stats.oldest_entry.strftime('%Y-%m-%d %H:%M')}")
+        lines.append(f"[bold]Oldest entry:[/bold] {stats.oldest_entry.strftime('%Y-%m-%d %H:%M')}")
     if stats.newest_entry:
-        console.print(f"[bold]Newest entry:[/bold] {stats.newest_entry.strftime('%Y-%m-%d %H:%M')}")
-    console.print()
+        lines.append(f"[bold]Newest entry:[/bold] {stats.newest_entry.strftime('%Y-%m-%d %H:%M')}")
+    lines.append("")
 
-    # Check for expired entries
-    expired = cache.get_expired_count()
+    # Report expired entries
     if expired > 0:
-        console.print(f"[yellow]Expired entries:[/yellow] {expired}")
-        console.print("[dim]Run 'cache clear' to remove expired entries.[/dim]")
+        lines.append(f"[yellow]Expired entries:[/yellow] {expired}")
+        lines.append("[dim]Run 'cache clear' to remove expired entries.[/dim]")
 
-    console.print()
-    console.print(f"Cache location: {cache.cache_dir}")
+    lines += ["", f"Cache location: {cache.cache_dir}"]
+    console.print("\n".join(lines))
 
 
 @cache.command(name="refresh")
@@ -1216,16 +1299,17 @@ def cache_refresh() -> None:
 
     Use this when you want to ensure fresh data is fetched on the next scan.
     """
-    from complexionist.cache import Cache
+    from complexionist.cache import create_cache
 
-    cache = Cache()
-    count = cache.refresh()
+    console = get_console()
+    with create_cache() as cache:
+        count = cache.refresh()
 
     if count == 0:
-        console.print("[dim]Cache was already empty.[/dim]")
+        message = "[dim]Cache was already empty.[/dim]"
     else:
-        console.print(f"[green]Refreshed cache - cleared {count} entries.[/green]")
-    console.print("[dim]Library fingerprints have been reset.[/dim]")
+        message = f"[green]Refreshed cache - cleared {count} entries.[/green]"
+    console.print(f"{message}\n[dim]Library fingerprints have been reset.[/dim]")
 
 
 if __name__ == "__main__":
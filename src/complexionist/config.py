@@ -3,21 +3,19 @@
 from __future__ import annotations
 
 import configparser
+import importlib.util
 import logging
 import os
 import re
 import sys
+from collections.abc import Iterator
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, Field
 
-try:
-    import yaml
-
-    _HAS_YAML = True
-except ImportError:
-    _HAS_YAML = False
+# PyYAML is only needed for legacy configs, so it is imported on demand
+_HAS_YAML = importlib.util.find_spec("yaml") is not None
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +23,8 @@ logger = logging.getLogger(__name__)
 class PlexServerConfig(BaseModel):
     """Single Plex server configuration."""
 
+    model_config = {"frozen": True, "extra": "ignore"}
+
     name: str = ""
     url: str = ""
     token: str = ""
@@ -33,6 +33,8 @@ class PlexServerConfig(BaseModel):
 class PlexConfig(BaseModel):
     """Plex server configuration (supports multiple servers)."""
 
+    model_config = {"frozen": True, "extra": "ignore"}
+
     servers: list[PlexServerConfig] = Field(default_factory=list)
 
     @property
@@ -49,21 +51,27 @@ class PlexConfig(BaseModel):
 class TMDBConfig(BaseModel):
     """TMDB API configuration."""
 
+    model_config = {"frozen": True, "extra": "ignore"}
+
     api_key: str | None = None
-    ignored_collections: list[int] = Field(default_factory=list)
+    ignored_collections: tuple[int, ...] = ()
 
 
 class TVDBConfig(BaseModel):
     """TVDB API configuration."""
 
+    model_config = {"frozen": True, "extra": "ignore"}
+
     api_key: str | None = None
     pin: str | None = None
-    ignored_shows: list[int] = Field(default_factory=list)
+    ignored_shows: tuple[int, ...] = ()
 
 
 class OptionsConfig(BaseModel):
     """General options configuration."""
 
+    model_config = {"frozen": True, "extra": "ignore"}
+
     exclude_future: bool = True
     exclude_specials: bool = True
     recent_threshold_hours: int = 24
@@ -75,8 +83,11 @@ class OptionsConfig(BaseModel):
 class ExclusionsConfig(BaseModel):
     """Content exclusion configuration."""
 
-    shows: list[str] = Field(default_factory=list)
-    collections: list[str] = Field(default_factory=list)
+    model_config = {"frozen": True, "extra": "ignore"}
+
+    # Read-only after load, so tuples let every instance share the empty default
+    shows: tuple[str, ...] = ()
+    collections: tuple[str, ...] = ()
 
 
 class PathsConfig(BaseModel):
@@ -87,24 +98,52 @@ class PathsConfig(BaseModel):
     (e.g., \\\\Storage4\\video), use these settings to map the paths.
     """
 
+    model_config = {"frozen": True, "extra": "ignore"}
+
     plex_prefix: str | None = None  # Path prefix as Plex sees it
     local_prefix: str | None = None  # Path prefix as local machine sees it
 
 
+class CacheConfig(BaseModel):
+    """API response cache configuration."""
+
+    model_config = {"frozen": True, "extra": "ignore"}
+
+    # "json": one complexionist.cache.json file; "sqlite": complexionist.cache.db
+    backend: Literal["json", "sqlite"] = "json"
+    # JSON backend only: zstd-compress the file (needs the "fast" extra)
+    compress: bool = False
+    # JSON backend only: fsync every save so a crash can't truncate the file
+    durable: bool = False
+
+
 class AppConfig(BaseModel):
     """Application configuration."""
 
+    model_config = {"frozen": True, "extra": "ignore"}
+
     plex: PlexConfig = Field(default_factory=PlexConfig)
     tmdb: TMDBConfig = Field(default_factory=TMDBConfig)
     tvdb: TVDBConfig = Field(default_factory=TVDBConfig)
     options: OptionsConfig = Field(default_factory=OptionsConfig)
     exclusions: ExclusionsConfig = Field(default_factory=ExclusionsConfig)
     paths: PathsConfig = Field(default_factory=PathsConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
 
 
 # Global config instance
 _config: AppConfig | None = None
 _config_path: Path | None = None  # Track where config was loaded from
+# Last find_config_file() result, keyed by the working directory it ran in
+_found_config: tuple[Path, Path | None] | None = None
+# Validated configs keyed by (path, mtime_ns, size), oldest first. Each entry also
+# keeps the values of the environment variables it expanded, checked on reuse.
+# Kept across reset_config(): callers reset before every reload, and the key and
+# variable check already catch a changed file or environment.
+_validated_configs: dict[
+    tuple[Path, int, int], tuple[AppConfig, tuple[tuple[str, str | None], ...]]
+] = {}
+_VALIDATED_CONFIGS_MAX = 4
 
 
 def is_frozen() -> bool:
@@ -136,6 +175,35 @@ def get_assets_directory() -> Path:
     return Path(__file__).parent.parent.parent / "assets"
 
 
+def _iter_config_paths() -> Iterator[Path]:
+    """Yield config file paths to search, in priority order.
+
+    Lazy so `find_config_file()` stops building paths at the first hit.
+    """
+    exe_dir = get_exe_directory()
+    home_dir = Path.home() / ".complexionist"
+
+    # 1. Exe directory - INI format (highest priority)
+    yield exe_dir / "complexionist.ini"
+
+    # 2. Current directory - INI format
+    cwd = Path.cwd()
+    if cwd != exe_dir:  # Avoid duplicates
+        yield cwd / "complexionist.ini"
+
+    # 3. Home directory - INI format
+    yield home_dir / "complexionist.ini"
+
+    # 4. Legacy YAML support (backwards compatibility, only if PyYAML installed)
+    if _HAS_YAML:
+        yield cwd / "config.yaml"
+        yield cwd / "config.yml"
+        yield cwd / ".complexionist.yaml"
+        yield cwd / ".complexionist.yml"
+        yield home_dir / "config.yaml"
+        yield home_dir / "config.yml"
+
+
 def get_config_paths() -> list[Path]:
     """Get list of config file paths to search, in priority order.
 
@@ -149,44 +217,84 @@ def get_config_paths() -> list[Path]:
     Returns:
         List of paths to check for config files.
     """
-    paths = []
+    return list(_iter_config_paths())
 
-    exe_dir = get_exe_directory()
-    home_dir = Path.home() / ".complexionist"
 
-    # 1. Exe directory - INI format (highest priority)
-    paths.append(exe_dir / "complexionist.ini")
+def find_config_file() -> Path | None:
+    """Find the first existing config file.
 
-    # 2. Current directory - INI format
+    The result is remembered for the current working directory, so repeated
+    lookups (GUI window/library state, validation) don't re-stat every
+    candidate. `reset_config()` and `save_default_config()` clear it.
+
+    Returns:
+        Path to config file if found, None otherwise.
+    """
+    global _found_config
     cwd = Path.cwd()
-    if cwd != exe_dir:  # Avoid duplicates
-        paths.append(cwd / "complexionist.ini")
+    if _found_config is not None and _found_config[0] == cwd:
+        return _found_config[1]
 
-    # 3. Home directory - INI format
-    paths.append(home_dir / "complexionist.ini")
+    # One directory listing per search location instead of a stat per candidate
+    listings: dict[Path, set[str]] = {}
+    found = None
+    for path in _iter_config_paths():
+        names = listings.get(path.parent)
+        if names is None:
+            names = listings[path.parent] = _list_file_names(path.parent)
+        if os.path.normcase(path.name) in names:
+            found = path
+            break
 
-    # 4. Legacy YAML support (backwards compatibility, only if PyYAML installed)
-    if _HAS_YAML:
-        paths.append(cwd / "config.yaml")
-        paths.append(cwd / "config.yml")
-        paths.append(cwd / ".complexionist.yaml")
-        paths.append(cwd / ".complexionist.yml")
-        paths.append(home_dir / "config.yaml")
-        paths.append(home_dir / "config.yml")
+    _found_config = (cwd, found)
+    return found
 
-    return paths
 
+def _list_file_names(directory: Path) -> set[str]:
+    """List the regular files in a directory, case-normalized for the platform.
 
-def find_config_file() -> Path | None:
-    """Find the first existing config file.
+    Args:
+        directory: Directory to list.
 
     Returns:
-        Path to config file if found, None otherwise.
+        File names passed through `os.path.normcase`; empty if unreadable.
     """
-    for path in get_config_paths():
-        if path.exists():
-            return path
-    return None
+    try:
+        with os.scandir(directory) as entries:
+            return {os.path.normcase(entry.name) for entry in entries if entry.is_file()}
+    except OSError:
+        return set()
+
+
+# Pattern matches ${VAR} or $VAR
+_ENV_VAR_PATTERN = re.compile(r"\$\{([^}]+)\}|\$([A-Za-z_][A-Za-z0-9_]*)")
+
+
+def _replace_env_var(match: re.Match[str]) -> str:
+    """Substitute one ${VAR}/$VAR match with its environment value (or "")."""
+    var_name = match.group(1) or match.group(2)
+    return os.environ.get(var_name, "")
+
+
+def _referenced_env_vars(value: Any) -> Iterator[str]:
+    """Yield the names of environment variables referenced in config values.
+
+    Args:
+        value: Config value (string, dict, list, or other).
+
+    Yields:
+        Variable names, in order of appearance (may repeat).
+    """
+    if isinstance(value, str):
+        if "$" in value:
+            for match in _ENV_VAR_PATTERN.finditer(value):
+                yield match.group(1) or match.group(2)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _referenced_env_vars(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _referenced_env_vars(item)
 
 
 def _expand_env_vars(value: Any) -> Any:
@@ -201,14 +309,9 @@ def _expand_env_vars(value: Any) -> Any:
         Value with environment variables expanded.
     """
     if isinstance(value, str):
-        # Pattern matches ${VAR} or $VAR
-        pattern = re.compile(r"\$\{([^}]+)\}|\$([A-Za-z_][A-Za-z0-9_]*)")
-
-        def replace(match: re.Match[str]) -> str:
-            var_name = match.group(1) or match.group(2)
-            return os.environ.get(var_name, "")
-
-        return pattern.sub(replace, value)
+        if "$" not in value:
+            return value  # Most values have no variables - skip the regex
+        return _ENV_VAR_PATTERN.sub(_replace_env_var, value)
     elif isinstance(value, dict):
         return {k: _expand_env_vars(v) for k, v in value.items()}
     elif isinstance(value, list):
@@ -379,6 +482,20 @@ def _load_ini_config(path: Path) -> dict[str, Any]:
         if paths:
             config["paths"] = paths
 
+    # Parse [cache] section
+    if parser.has_section("cache"):
+        cache_config: dict[str, Any] = {}
+        backend = parser.get("cache", "backend", fallback="").strip().lower()
+        if backend in ("json", "sqlite"):
+            cache_config["backend"] = backend
+        elif backend:
+            logger.warning("Unknown cache backend %r in %s, using json", backend, path)
+        for key in ("compress", "durable"):
+            if parser.has_option("cache", key):
+                cache_config[key] = _parse_bool(parser.get("cache", key))
+        if cache_config:
+            config["cache"] = cache_config
+
     return config
 
 
@@ -394,9 +511,13 @@ def _load_yaml_config(path: Path) -> dict[str, Any]:
     if not _HAS_YAML:
         logger.warning("PyYAML not installed — cannot load %s. Use INI format instead.", path)
         return {}
+    import yaml
+
+    # libyaml's C loader when PyYAML was built with it, pure Python otherwise
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
     try:
-        with open(path, encoding="utf-8") as f:
-            return yaml.safe_load(f) or {}
+        text = path.read_text(encoding="utf-8")
+        return yaml.load(text, Loader=loader) or {}
     except (yaml.YAMLError, OSError) as e:
         logger.error("Failed to load config from %s: %s", path, e)
         return {}
@@ -407,6 +528,9 @@ def load_config(path: Path | None = None) -> AppConfig:
 
     Supports both INI (.cfg) and YAML (.yaml/.yml) formats.
     Environment variables are expanded in all values using ${VAR} syntax.
+    Reloading a file whose mtime and size are unchanged, while the variables
+    it references keep their values, returns the model validated last time.
+    `reset_config()` discards these reusable models.
 
     Args:
         path: Explicit path to config file. If None, searches default locations.
@@ -420,23 +544,43 @@ def load_config(path: Path | None = None) -> AppConfig:
     if path is None:
         path = find_config_file()
 
-    if path is None or not path.exists():
+    try:
+        stat = path.stat() if path is not None else None
+    except OSError:
+        stat = None
+
+    if path is None or stat is None:
         # No config file, return defaults
         _config = AppConfig()
         _config_path = None
         return _config
 
-    # Load based on file extension
-    if path.suffix in (".ini", ".cfg"):
-        raw_config = _load_ini_config(path)
+    # An unchanged file with unchanged variables reuses its validated model
+    # (moved to the newest slot)
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    entry = _validated_configs.pop(key, None)
+    if entry is not None and all(os.environ.get(name) == value for name, value in entry[1]):
+        config, env_values = entry
     else:
-        raw_config = _load_yaml_config(path)
-
-    # Expand environment variables
-    expanded_config = _expand_env_vars(raw_config)
-
-    # Parse into config model
-    _config = AppConfig.model_validate(expanded_config)
+        # Load based on file extension
+        if path.suffix in (".ini", ".cfg"):
+            raw_config = _load_ini_config(path)
+        else:
+            raw_config = _load_yaml_config(path)
+
+        # Expand environment variables
+        env_values = tuple(
+            (name, os.environ.get(name)) for name in dict.fromkeys(_referenced_env_vars(raw_config))
+        )
+        expanded_config = _expand_env_vars(raw_config)
+
+        # Parse into config model
+        config = AppConfig.model_validate(expanded_config)
+        if len(_validated_configs) >= _VALIDATED_CONFIGS_MAX:
+            del _validated_configs[next(iter(_validated_configs))]
+    _validated_configs[key] = (config, env_values)
+
+    _config = config
     _config_path = path
     return _config
 
@@ -489,9 +633,10 @@ def reset_config() -> None:
 
     Useful for testing or when config file changes.
     """
-    global _config, _config_path
+    global _config, _config_path, _found_config
     _config = None
     _config_path = None
+    _found_config = None
 
 
 def get_config_dir() -> Path:
@@ -507,37 +652,8 @@ def get_config_dir() -> Path:
     return config_dir
 
 
-def save_default_config(
-    path: Path | None = None,
-    plex_url: str = "",
-    plex_token: str = "",
-    plex_name: str = "Plex Server",
-    tmdb_api_key: str = "",
-    tvdb_api_key: str = "",
-) -> Path:
-    """Save a default INI config file.
-
-    Args:
-        path: Where to save. Defaults to ./complexionist.ini (current directory).
-        plex_url: Plex server URL (optional, can use env var).
-        plex_token: Plex token (optional, can use env var).
-        plex_name: Plex server friendly name.
-        tmdb_api_key: TMDB API key (optional, can use env var).
-        tvdb_api_key: TVDB API key (optional, can use env var).
-
-    Returns:
-        Path to saved config file.
-    """
-    if path is None:
-        path = Path.cwd() / "complexionist.ini"
-
-    # Use provided values or fall back to env var syntax
-    plex_url_value = plex_url or "${PLEX_URL}"
-    plex_token_value = plex_token or "${PLEX_TOKEN}"
-    tmdb_key_value = tmdb_api_key or "${TMDB_API_KEY}"
-    tvdb_key_value = tvdb_api_key or "${TVDB_API_KEY}"
-
-    default_config = f"""\
+# Body of the file written by save_default_config(), filled in with str.format
+_DEFAULT_CONFIG_TEMPLATE = """\
 # ComPlexionist Configuration
 # See: https://github.com/The-Ant-Forge/ComPlexionist
 # You can use environment variables with ${{VAR}} syntax
@@ -580,14 +696,63 @@ collections =
 # accesses them as \\Storage4\video\\..., configure the mapping here:
 # plex_prefix = \\volume1\video
 # local_prefix = \\Storage4\video
+
+[cache]
+# Cache storage: json (single file, default) or sqlite (one row per entry)
+backend = json
+# json only: zstd-compress the cache file (requires the zstandard package)
+compress = false
+# json only: fsync every save (slower, survives power loss)
+durable = false
 """
 
+
+def save_default_config(
+    path: Path | None = None,
+    plex_url: str = "",
+    plex_token: str = "",
+    plex_name: str = "Plex Server",
+    tmdb_api_key: str = "",
+    tvdb_api_key: str = "",
+) -> Path:
+    """Save a default INI config file.
+
+    Args:
+        path: Where to save. Defaults to ./complexionist.ini (current directory).
+        plex_url: Plex server URL (optional, can use env var).
+        plex_token: Plex token (optional, can use env var).
+        plex_name: Plex server friendly name.
+        tmdb_api_key: TMDB API key (optional, can use env var).
+        tvdb_api_key: TVDB API key (optional, can use env var).
+
+    Returns:
+        Path to saved config file.
+    """
+    if path is None:
+        path = Path.cwd() / "complexionist.ini"
+
+    # Use provided values or fall back to env var syntax
+    plex_url_value = plex_url or "${PLEX_URL}"
+    plex_token_value = plex_token or "${PLEX_TOKEN}"
+    tmdb_key_value = tmdb_api_key or "${TMDB_API_KEY}"
+    tvdb_key_value = tvdb_api_key or "${TVDB_API_KEY}"
+
     # Ensure parent directory exists
     path.parent.mkdir(parents=True, exist_ok=True)
 
+    default_config = _DEFAULT_CONFIG_TEMPLATE.format(
+        plex_name=plex_name,
+        plex_url_value=plex_url_value,
+        plex_token_value=plex_token_value,
+        tmdb_key_value=tmdb_key_value,
+        tvdb_key_value=tvdb_key_value,
+    )
     with open(path, "w", encoding="utf-8") as f:
         f.write(default_config)
 
+    # A new file may now take priority in the config search, and the
+    # memoized config may be stale
+    reset_config()
     return path
 
 
@@ -639,6 +804,24 @@ def save_plex_servers(servers: list[PlexServerConfig]) -> bool:
     return True
 
 
+def _set_ignored_collections(collection_ids: tuple[int, ...]) -> bool:
+    """Replace the in-memory ignored collections and save them to the config file."""
+    global _config
+    config = get_config()
+    tmdb = config.tmdb.model_copy(update={"ignored_collections": collection_ids})
+    _config = config.model_copy(update={"tmdb": tmdb})
+    return _save_ignored_lists()
+
+
+def _set_ignored_shows(show_ids: tuple[int, ...]) -> bool:
+    """Replace the in-memory ignored shows and save them to the config file."""
+    global _config
+    config = get_config()
+    tvdb = config.tvdb.model_copy(update={"ignored_shows": show_ids})
+    _config = config.model_copy(update={"tvdb": tvdb})
+    return _save_ignored_lists()
+
+
 def add_ignored_collection(collection_id: int) -> bool:
     """Add a collection ID to the ignore list.
 
@@ -648,12 +831,11 @@ def add_ignored_collection(collection_id: int) -> bool:
     Returns:
         True if added, False if already ignored or no config file.
     """
-    config = get_config()
-    if collection_id in config.tmdb.ignored_collections:
+    ignored = get_config().tmdb.ignored_collections
+    if collection_id in ignored:
         return False
 
-    config.tmdb.ignored_collections.append(collection_id)
-    return _save_ignored_lists()
+    return _set_ignored_collections((*ignored, collection_id))
 
 
 def remove_ignored_collection(collection_id: int) -> bool:
@@ -665,12 +847,11 @@ def remove_ignored_collection(collection_id: int) -> bool:
     Returns:
         True if removed, False if not found or no config file.
     """
-    config = get_config()
-    if collection_id not in config.tmdb.ignored_collections:
+    ignored = get_config().tmdb.ignored_collections
+    if collection_id not in ignored:
         return False
 
-    config.tmdb.ignored_collections.remove(collection_id)
-    return _save_ignored_lists()
+    return _set_ignored_collections(tuple(i for i in ignored if i != collection_id))
 
 
 def add_ignored_show(show_id: int) -> bool:
@@ -682,12 +863,11 @@ def add_ignored_show(show_id: int) -> bool:
     Returns:
         True if added, False if already ignored or no config file.
     """
-    config = get_config()
-    if show_id in config.tvdb.ignored_shows:
+    ignored = get_config().tvdb.ignored_shows
+    if show_id in ignored:
         return False
 
-    config.tvdb.ignored_shows.append(show_id)
-    return _save_ignored_lists()
+    return _set_ignored_shows((*ignored, show_id))
 
 
 def remove_ignored_show(show_id: int) -> bool:
@@ -699,12 +879,11 @@ def remove_ignored_show(show_id: int) -> bool:
     Returns:
         True if removed, False if not found or no config file.
     """
-    config = get_config()
-    if show_id not in config.tvdb.ignored_shows:
+    ignored = get_config().tvdb.ignored_shows
+    if show_id not in ignored:
         return False
 
-    config.tvdb.ignored_shows.remove(show_id)
-    return _save_ignored_lists()
+    return _set_ignored_shows(tuple(i for i in ignored if i != show_id))
 
 
 def map_plex_path(path: str | None) -> str | None:
@@ -5,6 +5,8 @@ Centralizes constants used across CLI and GUI modules.
 
 from __future__ import annotations
 
+from bisect import bisect_right
+
 # =============================================================================
 # Brand Colors
 # =============================================================================
@@ -24,6 +26,10 @@ SCORE_THRESHOLD_GOOD = 90  # Score >= 90% is "good" (green)
 SCORE_THRESHOLD_WARNING = 70  # Score >= 70% is "warning" (yellow/orange)
 # Score < 70% is "bad" (red)
 
+# Ascending thresholds and the rating below, between and above them
+_SCORE_THRESHOLDS = (SCORE_THRESHOLD_WARNING, SCORE_THRESHOLD_GOOD)
+_SCORE_RATINGS = ("bad", "warning", "good")
+
 # Cache hit rate threshold for "good" display (percentage)
 CACHE_HIT_RATE_GOOD = 50  # > 50% is good (green), <= 50% is warning (orange)
 
@@ -37,8 +43,4 @@ def get_score_rating(score: float) -> str:
     Returns:
         Rating string: "good", "warning", or "bad".
     """
-    if score >= SCORE_THRESHOLD_GOOD:
-        return "good"
-    elif score >= SCORE_THRESHOLD_WARNING:
-        return "warning"
-    return "bad"
+    return _SCORE_RATINGS[bisect_right(_SCORE_THRESHOLDS, score)]
@@ -5,6 +5,8 @@ Provides user-friendly error message conversion used by both CLI and GUI.
 
 from __future__ import annotations
 
+import re
+
 # =============================================================================
 # User-friendly error messages
 # =============================================================================
@@ -21,6 +23,20 @@ ERROR_TVDB_RATE_LIMIT = "TVDB rate limit reached. Please wait a moment and try a
 ERROR_NO_CONFIG = "No configuration found. Please run the setup wizard."
 
 
+# Exception class names (lowercased) that map straight to a message once the
+# connection and Plex checks have passed
+_TYPE_MESSAGES: dict[str, str] = {
+    "tmdbautherror": ERROR_TMDB_UNAUTHORIZED,
+    "tmdbratelimiterror": ERROR_TMDB_RATE_LIMIT,
+    "tvdbautherror": ERROR_TVDB_UNAUTHORIZED,
+    "tvdbratelimiterror": ERROR_TVDB_RATE_LIMIT,
+}
+
+_TIMEOUT_PATTERN = re.compile(r"timeout|timed out")
+_UNAUTHORIZED_PATTERN = re.compile(r"401|unauthorized")
+_TECHNICAL_PATTERN = re.compile(r"traceback|exception|error:|errno")
+
+
 def get_friendly_message(error: Exception) -> str:
     """Convert a technical exception to a user-friendly message.
 
@@ -30,38 +46,31 @@ def get_friendly_message(error: Exception) -> str:
     Returns:
         A user-friendly error message.
     """
-    error_str = str(error).lower()
-    error_type = type(error).__name__
+    message = str(error)
+    error_str = message.lower()
+    error_type = type(error).__name__.lower()
 
     # Connection errors
-    if "connection refused" in error_str or "connectrefusederror" in error_type.lower():
+    if error_type == "connectrefusederror" or "connection refused" in error_str:
         return ERROR_CONNECTION_REFUSED
-    if "timeout" in error_str or "timed out" in error_str:
+    if _TIMEOUT_PATTERN.search(error_str):
         return ERROR_CONNECTION_TIMEOUT
 
     # Plex errors
-    if "plexautherror" in error_type.lower() or "401" in error_str:
-        if "plex" in error_str:
-            return ERROR_PLEX_UNAUTHORIZED
-    if "plexnotfounderror" in error_type.lower() or "plexerror" in error_type.lower():
-        if "not found" in error_str:
-            return ERROR_PLEX_NOT_FOUND
-
-    # TMDB errors
-    if "tmdbautherror" in error_type.lower():
-        return ERROR_TMDB_UNAUTHORIZED
-    if "tmdbratelimiterror" in error_type.lower():
-        return ERROR_TMDB_RATE_LIMIT
-    if "tmdb" in error_str and ("401" in error_str or "unauthorized" in error_str):
-        return ERROR_TMDB_UNAUTHORIZED
-
-    # TVDB errors
-    if "tvdbautherror" in error_type.lower():
-        return ERROR_TVDB_UNAUTHORIZED
-    if "tvdbratelimiterror" in error_type.lower():
-        return ERROR_TVDB_RATE_LIMIT
-    if "tvdb" in error_str and ("401" in error_str or "unauthorized" in error_str):
-        return ERROR_TVDB_UNAUTHORIZED
+    if (error_type == "plexautherror" or "401" in error_str) and "plex" in error_str:
+        return ERROR_PLEX_UNAUTHORIZED
+    if error_type in ("plexnotfounderror", "plexerror") and "not found" in error_str:
+        return ERROR_PLEX_NOT_FOUND
+
+    # TMDB/TVDB errors
+    type_message = _TYPE_MESSAGES.get(error_type)
+    if type_message is not None:
+        return type_message
+    if _UNAUTHORIZED_PATTERN.search(error_str):
+        if "tmdb" in error_str:
+            return ERROR_TMDB_UNAUTHORIZED
+        if "tvdb" in error_str:
+            return ERROR_TVDB_UNAUTHORIZED
 
     # Config errors
     if "no configuration" in error_str or "config" in error_str and "not found" in error_str:
@@ -69,9 +78,7 @@ def get_friendly_message(error: Exception) -> str:
 
     # Default - return the original error message if it's already user-friendly
     # Otherwise return generic message
-    if len(str(error)) < 100 and not any(
-        tech in error_str for tech in ["traceback", "exception", "error:", "errno"]
-    ):
-        return str(error)
+    if len(message) < 100 and not _TECHNICAL_PATTERN.search(error_str):
+        return message
 
     return ERROR_UNKNOWN
@@ -10,6 +10,9 @@ from __future__ import annotations
 import time
 from dataclasses import dataclass, field
 
+# Cap on the sample counter; it is only compared against min_samples
+_MAX_SAMPLES = 1_000_000
+
 
 def _extract_phase_key(phase: str) -> str:
     """Extract the phase action from a progress string.
@@ -17,9 +20,8 @@ def _extract_phase_key(phase: str) -> str:
     Splits "Checking: Movie Name" → "Checking".
     Returns the full string if no colon separator is found.
     """
-    if ": " in phase:
-        return phase.split(": ", 1)[0]
-    return phase
+    head, sep, _ = phase.partition(": ")
+    return head if sep else phase
 
 
 def _format_seconds(seconds: float) -> str:
@@ -28,37 +30,33 @@ def _format_seconds(seconds: float) -> str:
     Examples: "~7s remaining", "~25s remaining", "~2m 30s remaining",
               "~1h 15m remaining"
     """
-    seconds = max(0, seconds)
-
-    if seconds < 10:
-        # Round to nearest 1s for short ETAs
-        s = max(1, round(seconds))
-        return f"~{s}s remaining"
-    elif seconds < 60:
-        # Round to nearest 5s
-        s = round(seconds / 5) * 5
-        s = max(5, s)
-        return f"~{s}s remaining"
-    elif seconds < 3600:
-        mins = int(seconds // 60)
-        secs = int(seconds % 60)
-        # Round seconds to nearest 10s for cleaner display
-        secs = round(secs / 10) * 10
+    # Round once to whole seconds; everything below is integer arithmetic
+    s = int(seconds + 0.5) if seconds > 0 else 0
+
+    if s < 10:
+        # Nearest 1s for short ETAs
+        return f"~{max(1, s)}s remaining"
+    if s < 60:
+        # Nearest 5s
+        return f"~{max(5, (s + 2) // 5 * 5)}s remaining"
+    if s < 3600:
+        mins, secs = divmod(s, 60)
+        # Nearest 10s for cleaner display
+        secs = (secs + 5) // 10 * 10
         if secs == 60:
             mins += 1
             secs = 0
-        if secs > 0:
+        if secs:
             return f"~{mins}m {secs}s remaining"
         return f"~{mins}m remaining"
-    else:
-        hours = int(seconds // 3600)
-        mins = int((seconds % 3600) // 60)
-        if mins > 0:
-            return f"~{hours}h {mins}m remaining"
-        return f"~{hours}h remaining"
+
+    hours, mins = divmod(s // 60, 60)
+    if mins:
+        return f"~{hours}h {mins}m remaining"
+    return f"~{hours}h remaining"
 
 
-@dataclass
+@dataclass(slots=True)
 class ETACalculator:
     """Calculates ETA for scan progress using Exponential Moving Average.
 
@@ -108,7 +106,8 @@ class ETACalculator:
             total: Total items in this phase.
         """
         now = time.monotonic()
-        phase_key = _extract_phase_key(phase)
+        # A phase without an item suffix is its own key, so skip the split
+        phase_key = phase if phase == self._last_phase_key else _extract_phase_key(phase)
 
         # Detect phase change or total change → reset EMA
         if phase_key != self._last_phase_key or total != self._last_total:
@@ -124,8 +123,10 @@ class ETACalculator:
                 if self._samples == 0:
                     self._ema_duration = dt
                 else:
-                    self._ema_duration = self.alpha * dt + (1 - self.alpha) * self._ema_duration
-                self._samples += 1
+                    self._ema_duration += self.alpha * (dt - self._ema_duration)
+                # Only min_samples matters past this point; keep the count bounded
+                if self._samples < _MAX_SAMPLES:
+                    self._samples += 1
 
         self._last_time = now
 
@@ -147,23 +148,23 @@ class ETACalculator:
         Returns display text like "~2m 30s remaining", "Calculating...",
         or "" (empty for indeterminate progress).
         """
+        # Indeterminate progress: nothing to show
+        if self._remaining is None and self._samples == 0:
+            return ""
+
+        # Flicker protection: only update display every min_update_interval.
+        # Checked before formatting so suppressed ticks do no string work.
         now = time.monotonic()
+        if self._last_display_text and now - self._last_display_time < self.min_update_interval:
+            return self._last_display_text
 
-        # Not enough data yet but we have started
         if self._remaining is None:
-            if self._samples > 0:
-                text = "Calculating..."
-            else:
-                return ""
+            text = "Calculating..."
         elif self._remaining < 1.0:
             text = "Almost done..."
         else:
             text = _format_seconds(self._remaining)
 
-        # Flicker protection: only update display every min_update_interval
-        if self._last_display_text and now - self._last_display_time < self.min_update_interval:
-            return self._last_display_text
-
         self._last_display_time = now
         self._last_display_text = text
         return text
@@ -1,7 +1,7 @@
 """Episode gap detection logic."""
 
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from datetime import UTC, datetime, timedelta
 
 from complexionist.gaps.models import (
@@ -79,8 +79,8 @@ class EpisodeGapFinder:
         include_future: bool = False,
         include_specials: bool = False,
         recent_threshold_hours: int = 0,
-        excluded_shows: list[str] | None = None,
-        ignored_show_ids: list[int] | None = None,
+        excluded_shows: Iterable[str] | None = None,
+        ignored_show_ids: Iterable[int] | None = None,
         progress_callback: Callable[[str, int, int], None] | None = None,
     ) -> None:
         """Initialize the gap finder.
@@ -102,7 +102,7 @@ class EpisodeGapFinder:
         self.include_future = include_future
         self.include_specials = include_specials
         self.recent_threshold_hours = recent_threshold_hours
-        self.excluded_shows = {s.lower() for s in (excluded_shows or [])}
+        self.excluded_shows = {s.lower() for s in (excluded_shows or ())}
         self.ignored_show_ids = set(ignored_show_ids or [])
         self._progress = progress_callback or (lambda *args: None)
 
@@ -2,7 +2,7 @@
 
 import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Sequence
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date
 
@@ -12,6 +12,7 @@ from complexionist.tmdb import (
     TMDBClient,
     TMDBCollection,
     TMDBError,
+    TMDBMovie,
     TMDBNotFoundError,
     TMDBRateLimitError,
 )
@@ -28,8 +29,8 @@ class MovieGapFinder:
         include_future: bool = False,
         min_collection_size: int = 2,
         min_owned: int = 2,
-        excluded_collections: list[str] | None = None,
-        ignored_collection_ids: list[int] | None = None,
+        excluded_collections: Iterable[str] | None = None,
+        ignored_collection_ids: Iterable[int] | None = None,
         progress_callback: Callable[[str, int, int], None] | None = None,
     ) -> None:
         """Initialize the gap finder.
@@ -52,7 +53,7 @@ class MovieGapFinder:
         self.include_future = include_future
         self.min_collection_size = min_collection_size
         self.min_owned = min_owned
-        self.excluded_collections = {c.lower() for c in (excluded_collections or [])}
+        self.excluded_collections = {c.lower() for c in (excluded_collections or ())}
         self.ignored_collection_ids = set(ignored_collection_ids or [])
         self._progress = progress_callback or (lambda *args: None)
 
@@ -196,8 +197,7 @@ class MovieGapFinder:
         Returns:
             Collection ID if the movie belongs to one, None otherwise.
         """
-        movie_details = self.tmdb.get_movie(tmdb_id)
-        return movie_details.collection_id
+        return self.tmdb.get_movie_collection_id(tmdb_id)
 
     def _find_collection_gaps(
         self,
@@ -251,6 +251,7 @@ class MovieGapFinder:
                 continue
 
             # Get movies to consider (released or all if include_future)
+            movies_to_check: Sequence[TMDBMovie]
             if self.include_future:
                 movies_to_check = collection.parts
             else:
@@ -838,7 +838,7 @@ def _execute_scan_with_pubsub(state: AppState, page: ft.Page) -> None:
     """
 
     from complexionist.api.base import BaseAPIClient
-    from complexionist.cache import Cache
+    from complexionist.cache import create_cache
     from complexionist.config import get_config
     from complexionist.gaps import EpisodeGapFinder, MovieGapFinder
     from complexionist.plex import PlexClient
@@ -874,7 +874,7 @@ def _execute_scan_with_pubsub(state: AppState, page: ft.Page) -> None:
 
     # Show initialization steps
     update_progress("Loading cache...", 0, 0)
-    cache = Cache()
+    cache = create_cache()
     update_progress("Cache loaded", 0, 0)
 
     update_progress("Connecting to Plex...", 0, 0)
@@ -938,6 +938,7 @@ def _execute_scan_with_pubsub(state: AppState, page: ft.Page) -> None:
         # Always flush cache, then prune expired entries during idle time
         cache.flush()
         cache.cleanup_expired()
+        cache.close()
 
     # Stop statistics tracking
     stats.stop()
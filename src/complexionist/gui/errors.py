@@ -13,6 +13,9 @@ import flet as ft
 # Import shared error message function
 from complexionist.errors import get_friendly_message
 
+# Marks the snackbar that show_error/show_warning/show_success/show_info share
+_SHARED_SNACKBAR = "complexionist-shared-snackbar"
+
 
 def _get_log_file_path() -> Path:
     """Get the path to the error log file (in exe folder or cwd)."""
@@ -51,6 +54,45 @@ def log_error(error: Exception | str, context: str = "") -> None:
         pass
 
 
+def _show_snackbar(
+    page: ft.Page,
+    content: ft.Control,
+    bgcolor: str,
+    duration: int | None,
+    action: str | None = None,
+) -> None:
+    """Show content in the page's shared snackbar, creating it on first use.
+
+    Reusing one overlay control keeps page.overlay from growing with every
+    message and sends the client a property update rather than a new control.
+
+    Args:
+        page: The Flet page to show the snackbar on.
+        content: Snackbar body.
+        bgcolor: Background color.
+        duration: Milliseconds to show it, or None to stay until dismissed.
+        action: Optional action button label.
+    """
+    snack = next(
+        (
+            control
+            for control in page.overlay
+            if isinstance(control, ft.SnackBar) and control.data == _SHARED_SNACKBAR
+        ),
+        None,
+    )
+    if snack is None:
+        snack = ft.SnackBar(content=content, data=_SHARED_SNACKBAR)
+        page.overlay.append(snack)
+
+    snack.content = content
+    snack.bgcolor = bgcolor
+    snack.duration = duration
+    snack.action = action
+    snack.open = True
+    page.update()
+
+
 def show_error(
     page: ft.Page,
     error: Exception | str,
@@ -91,16 +133,14 @@ def show_error(
     else:
         text_content = ft.Text(message)
 
-    # Create snackbar - persistent errors need action to dismiss
-    snack = ft.SnackBar(
-        content=text_content,
-        bgcolor=ft.Colors.RED_700,
+    # Persistent errors need action to dismiss
+    _show_snackbar(
+        page,
+        text_content,
+        ft.Colors.RED_700,
         duration=None if persistent else 5000,  # None = stays until dismissed
         action="Dismiss" if persistent else None,
     )
-    page.overlay.append(snack)
-    snack.open = True
-    page.update()
 
 
 def show_warning(
@@ -116,14 +156,7 @@ def show_warning(
         message: The warning message.
         duration: How long to show the snackbar in milliseconds.
     """
-    snack = ft.SnackBar(
-        content=ft.Text(message),
-        bgcolor=ft.Colors.ORANGE_700,
-        duration=duration,
-    )
-    page.overlay.append(snack)
-    snack.open = True
-    page.update()
+    _show_snackbar(page, ft.Text(message), ft.Colors.ORANGE_700, duration)
 
 
 def show_success(
@@ -139,14 +172,7 @@ def show_success(
         message: The success message.
         duration: How long to show the snackbar in milliseconds.
     """
-    snack = ft.SnackBar(
-        content=ft.Text(message),
-        bgcolor=ft.Colors.GREEN_700,
-        duration=duration,
-    )
-    page.overlay.append(snack)
-    snack.open = True
-    page.update()
+    _show_snackbar(page, ft.Text(message), ft.Colors.GREEN_700, duration)
 
 
 def show_info(
@@ -162,11 +188,4 @@ def show_info(
         message: The info message.
         duration: How long to show the snackbar in milliseconds.
     """
-    snack = ft.SnackBar(
-        content=ft.Text(message),
-        bgcolor=ft.Colors.BLUE_700,
-        duration=duration,
-    )
-    page.overlay.append(snack)
-    snack.open = True
-    page.update()
+    _show_snackbar(page, ft.Text(message), ft.Colors.BLUE_700, duration)
@@ -39,10 +39,10 @@ class DashboardScreen(BaseScreen):
 
     def _clear_cache(self, e: ft.ControlEvent) -> None:
         """Clear the API response cache."""
-        from complexionist.cache import Cache
+        from complexionist.cache import create_cache
 
-        cache = Cache()
-        count = cache.clear()
+        with create_cache() as cache:
+            count = cache.clear()
 
         from complexionist.gui.errors import show_success
 
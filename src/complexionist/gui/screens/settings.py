@@ -503,10 +503,10 @@ class SettingsScreen(BaseScreen):
 
     def _clear_cache(self, e: ft.ControlEvent) -> None:
         """Clear the API response cache."""
-        from complexionist.cache import Cache
+        from complexionist.cache import create_cache
 
-        cache = Cache()
-        count = cache.clear()
+        with create_cache() as cache:
+            count = cache.clear()
 
         self.page.snack_bar = ft.SnackBar(
             content=ft.Text(f"Cache cleared: {count} entries removed"),
@@ -516,24 +516,23 @@ class SettingsScreen(BaseScreen):
 
     def _populate_ignored_names_from_cache(self) -> None:
         """Look up names for ignored items from the cache."""
-        from complexionist.cache import Cache
+        from complexionist.cache import create_cache
 
         config = get_config()
-        cache = Cache()
-
-        # Resolve collection names from TMDB cache
-        for coll_id in config.tmdb.ignored_collections:
-            if coll_id not in self.state.ignored_collection_names:
-                cached = cache.get("tmdb", "collections", str(coll_id))
-                if cached and cached.get("name"):
-                    self.state.ignored_collection_names[coll_id] = cached["name"]
-
-        # Resolve show names from TVDB cache
-        for show_id in config.tvdb.ignored_shows:
-            if show_id not in self.state.ignored_show_names:
-                cached = cache.get("tvdb", "series", str(show_id))
-                if cached and cached.get("name"):
-                    self.state.ignored_show_names[show_id] = cached["name"]
+        with create_cache() as cache:
+            # Resolve collection names from TMDB cache
+            for coll_id in config.tmdb.ignored_collections:
+                if coll_id not in self.state.ignored_collection_names:
+                    cached = cache.get("tmdb", "collections", str(coll_id))
+                    if cached and cached.get("name"):
+                        self.state.ignored_collection_names[coll_id] = cached["name"]
+
+            # Resolve show names from TVDB cache
+            for show_id in config.tvdb.ignored_shows:
+                if show_id not in self.state.ignored_show_names:
+                    cached = cache.get("tvdb", "series", str(show_id))
+                    if cached and cached.get("name"):
+                        self.state.ignored_show_names[show_id] = cached["name"]
 
     def _create_ignored_items_section(self) -> ft.Card:
         """Create the ignored items management section."""
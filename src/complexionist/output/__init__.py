@@ -10,44 +10,153 @@ import csv
 import io
 import json
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from datetime import date
 from pathlib import Path
-from typing import TYPE_CHECKING
-
-from rich.console import Console
+from typing import TYPE_CHECKING, Any, TextIO
 
+from complexionist._console import get_console
 from complexionist.constants import SCORE_THRESHOLD_GOOD, SCORE_THRESHOLD_WARNING
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 if TYPE_CHECKING:
     from complexionist.gaps.models import EpisodeGapReport, MovieGapReport
     from complexionist.statistics import ScanStatistics
 
+# A CSV row: strings plus the integer IDs/numbers csv.writer formats itself
+_CSVRow = tuple[str | int, ...]
+
+_CSV_BUFFER_SIZE = 1 << 20
+
+_MOVIE_CSV_HEADER = ("Collection", "Movie Title", "Year", "TMDB ID", "Release Date", "TMDB URL")
+_TV_CSV_HEADER = (
+    "Show",
+    "Resolution",
+    "Codec",
+    "Season",
+    "Episode",
+    "Title",
+    "TVDB ID",
+    "Aired",
+    "TVDB URL",
+)
+
+
+def _json_default(obj: Any) -> str:
+    """Encode dates as ISO strings for the stdlib encoder (orjson does this natively)."""
+    if isinstance(obj, date):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _to_json(data: dict[str, Any], compact: bool = False) -> str:
+    """Serialize a report as JSON (orjson when available).
+
+    Report dicts may hold `date` values directly; both encoders write them
+    as ISO strings, so callers don't need per-item `isoformat()` calls.
+
+    Args:
+        data: Report dictionary.
+        compact: If True, omit all whitespace; otherwise indent by 2 spaces.
+    """
+    if _HAS_ORJSON:
+        option = 0 if compact else orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option).decode("utf-8")
+    if compact:
+        return json.dumps(data, separators=(",", ":"), default=_json_default)
+    return json.dumps(data, indent=2, default=_json_default)
+
+
+def _open_csv(path: Path) -> TextIO:
+    """Open a CSV file for writing with a large buffer.
+
+    A 1 MiB buffer means even large reports reach the disk in one or two
+    writes instead of a syscall per default-sized (8 KiB) chunk.
+    """
+    return open(path, "w", newline="", encoding="utf-8", buffering=_CSV_BUFFER_SIZE)
+
+
+class _FilenameTable(dict[int, str]):
+    """`str.translate` table that maps unsafe filename characters to "_".
 
-console = Console()
+    Letters and digits (including non-ASCII ones, per `str.isalnum`), "-" and
+    "_" are kept; everything else, spaces included, becomes "_". Entries are
+    computed on first sight of each character and memoized.
+    """
+
+    def __missing__(self, codepoint: int) -> str:
+        char = chr(codepoint)
+        safe = char if char.isalnum() or char in "-_" else "_"
+        self[codepoint] = safe
+        return safe
+
+
+_FILENAME_TABLE = _FilenameTable()
 
 
 class ReportFormatter(ABC):
     """Abstract base class for report formatting."""
 
+    report: MovieGapReport | EpisodeGapReport
+    csv_header: tuple[str, ...]
+    csv_file_kind: str  # Filename infix, e.g. "movie" -> Movies_movie_gaps_<date>.csv
+
     @abstractmethod
-    def to_json(self) -> str:
-        """Convert report to JSON string."""
+    def to_json(self, compact: bool = False) -> str:
+        """Convert report to JSON string (indented unless `compact`)."""
         pass
 
     @abstractmethod
+    def _iter_csv_rows(self) -> Iterator[_CSVRow]:
+        """Yield one CSV row per missing item."""
+        pass
+
+    def write_csv(self, file: TextIO, lineterminator: str = "\r\n") -> None:
+        """Write report as CSV rows to an open text file.
+
+        Args:
+            file: Destination opened with ``newline=""`` (as `save_csv` does).
+            lineterminator: Row ending. Pass ``"\n"`` for text-mode streams such
+                as stdout, which translate newlines themselves.
+        """
+        writer = csv.writer(file, lineterminator=lineterminator)
+        writer.writerow(self.csv_header)
+        writer.writerows(self._iter_csv_rows())
+
     def to_csv(self) -> str:
         """Convert report to CSV string."""
-        pass
+        output = io.StringIO()
+        self.write_csv(output)
+        return output.getvalue()
 
     @abstractmethod
     def to_text(self, verbose: bool = False) -> None:
         """Output report as formatted text to console."""
         pass
 
-    @abstractmethod
-    def save_csv(self) -> Path:
-        """Save report as CSV file and return path."""
-        pass
+    def save_csv(self, directory: Path | None = None, run_date: date | None = None) -> Path:
+        """Save report as CSV file and return path.
+
+        Args:
+            directory: Where to write the file. Defaults to the current directory.
+            run_date: Date used in the filename. Defaults to today; pass one date
+                for all reports of a run so their filenames match.
+        """
+        safe_name = self._sanitize_filename(self.report.library_name)
+        run_date = run_date or date.today()
+        filename = f"{safe_name}_{self.csv_file_kind}_gaps_{run_date.isoformat()}.csv"
+        filepath = (directory or Path.cwd()) / filename
+
+        with _open_csv(filepath) as f:
+            self.write_csv(f)
+
+        return filepath
 
     @abstractmethod
     def show_summary(
@@ -61,8 +170,7 @@ class ReportFormatter(ABC):
     @staticmethod
     def _sanitize_filename(name: str) -> str:
         """Sanitize a string for use in a filename."""
-        safe = "".join(c if c.isalnum() or c in " -_" else "_" for c in name)
-        return safe.replace(" ", "_")
+        return name.translate(_FILENAME_TABLE)
 
     @staticmethod
     def _get_score_color(score: float) -> str:
@@ -103,11 +211,15 @@ class ReportFormatter(ABC):
 class MovieReportFormatter(ReportFormatter):
     """Formatter for movie gap reports."""
 
+    report: MovieGapReport
+    csv_header = _MOVIE_CSV_HEADER
+    csv_file_kind = "movie"
+
     def __init__(self, report: MovieGapReport) -> None:
         self.report = report
 
-    def to_json(self) -> str:
-        """Convert movie gap report to JSON string."""
+    def to_json(self, compact: bool = False) -> str:
+        """Convert movie gap report to JSON string (indented unless `compact`)."""
         output = {
             "library_name": self.report.library_name,
             "total_movies_scanned": self.report.total_movies_scanned,
@@ -128,7 +240,7 @@ class MovieReportFormatter(ReportFormatter):
                             "tmdb_id": m.tmdb_id,
                             "title": m.title,
                             "year": m.year,
-                            "release_date": m.release_date.isoformat() if m.release_date else None,
+                            "release_date": m.release_date,
                             "url": m.tmdb_url,
                         }
                         for m in gap.missing_movies
@@ -137,33 +249,24 @@ class MovieReportFormatter(ReportFormatter):
                 for gap in self.report.collections_with_gaps
             ],
         }
-        return json.dumps(output, indent=2)
-
-    def to_csv(self) -> str:
-        """Convert movie gap report to CSV string."""
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(
-            ["Collection", "Movie Title", "Year", "TMDB ID", "Release Date", "TMDB URL"]
-        )
+        return _to_json(output, compact)
 
+    def _iter_csv_rows(self) -> Iterator[_CSVRow]:
+        """Yield one CSV row per missing movie."""
         for gap in self.report.collections_with_gaps:
             for movie in gap.missing_movies:
-                writer.writerow(
-                    [
-                        gap.collection_name,
-                        movie.title,
-                        movie.year or "",
-                        movie.tmdb_id,
-                        movie.release_date.isoformat() if movie.release_date else "",
-                        movie.tmdb_url,
-                    ]
+                yield (
+                    gap.collection_name,
+                    movie.title,
+                    movie.year or "",
+                    movie.tmdb_id,
+                    movie.release_date.isoformat() if movie.release_date else "",
+                    movie.tmdb_url,
                 )
 
-        return output.getvalue()
-
     def to_text(self, verbose: bool = False) -> None:
         """Output movie gap report as formatted text."""
+        console = get_console()
         console.print()
         console.print(f"[bold blue]Movie Collection Gaps - {self.report.library_name}[/bold blue]")
         console.print()
@@ -208,27 +311,19 @@ class MovieReportFormatter(ReportFormatter):
                 max_display = 5 if not verbose else len(gap.missing_movies)
                 displayed = gap.missing_movies[:max_display]
 
-                for movie in displayed:
-                    year_str = f" ({movie.year})" if movie.year else ""
-                    console.print(f"  - {movie.title}{year_str}")
-
+                # One print per collection: each console.print is a full render pass
+                lines = [
+                    f"  - {movie.title}" + (f" ({movie.year})" if movie.year else "")
+                    for movie in displayed
+                ]
                 remaining = len(gap.missing_movies) - max_display
                 if remaining > 0:
-                    console.print(f"  [dim]... and {remaining} more[/dim]")
+                    lines.append(f"  [dim]... and {remaining} more[/dim]")
+                if lines:
+                    console.print("\n".join(lines))
 
             console.print()
 
-    def save_csv(self) -> Path:
-        """Save movie gap report as CSV file."""
-        safe_name = self._sanitize_filename(self.report.library_name)
-        filename = f"{safe_name}_movie_gaps_{date.today().isoformat()}.csv"
-        filepath = Path.cwd() / filename
-
-        with open(filepath, "w", newline="", encoding="utf-8") as f:
-            f.write(self.to_csv())
-
-        return filepath
-
     def show_summary(
         self,
         stats: ScanStatistics,
@@ -241,6 +336,7 @@ class MovieReportFormatter(ReportFormatter):
 
         from complexionist.statistics import calculate_movie_score
 
+        console = get_console()
         # Calculate score (only incomplete collections affect score)
         incomplete = [g for g in self.report.collections_with_gaps if not g.is_complete]
         disorganized = [g for g in self.report.collections_with_gaps if g.is_complete]
@@ -297,6 +393,10 @@ class MovieReportFormatter(ReportFormatter):
 class TVReportFormatter(ReportFormatter):
     """Formatter for TV episode gap reports."""
 
+    report: EpisodeGapReport
+    csv_header = _TV_CSV_HEADER
+    csv_file_kind = "tv"
+
     def __init__(self, report: EpisodeGapReport) -> None:
         self.report = report
 
@@ -305,8 +405,8 @@ class TVReportFormatter(ReportFormatter):
         """Get TVDB series page URL."""
         return f"https://www.thetvdb.com/?tab=series&id={tvdb_id}"
 
-    def to_json(self) -> str:
-        """Convert episode gap report to JSON string."""
+    def to_json(self, compact: bool = False) -> str:
+        """Convert episode gap report to JSON string (indented unless `compact`)."""
         output = {
             "library_name": self.report.library_name,
             "total_shows_scanned": self.report.total_shows_scanned,
@@ -332,7 +432,7 @@ class TVReportFormatter(ReportFormatter):
                                     "tvdb_id": ep.tvdb_id,
                                     "episode_code": ep.episode_code,
                                     "title": ep.title,
-                                    "aired": ep.aired.isoformat() if ep.aired else None,
+                                    "aired": ep.aired,
                                 }
                                 for ep in season.missing_episodes
                             ],
@@ -343,48 +443,29 @@ class TVReportFormatter(ReportFormatter):
                 for show in self.report.shows_with_gaps
             ],
         }
-        return json.dumps(output, indent=2)
-
-    def to_csv(self) -> str:
-        """Convert episode gap report to CSV string."""
-        output = io.StringIO()
-        writer = csv.writer(output)
-        writer.writerow(
-            [
-                "Show",
-                "Resolution",
-                "Codec",
-                "Season",
-                "Episode",
-                "Title",
-                "TVDB ID",
-                "Aired",
-                "TVDB URL",
-            ]
-        )
+        return _to_json(output, compact)
 
+    def _iter_csv_rows(self) -> Iterator[_CSVRow]:
+        """Yield one CSV row per missing episode."""
         for show in self.report.shows_with_gaps:
             show_url = self._tvdb_series_url(show.tvdb_id)
             for season in show.seasons_with_gaps:
                 for ep in season.missing_episodes:
-                    writer.writerow(
-                        [
-                            show.show_title,
-                            show.resolution or "",
-                            show.video_codec or "",
-                            season.season_number,
-                            ep.episode_code,
-                            ep.title or "",
-                            ep.tvdb_id,
-                            ep.aired.isoformat() if ep.aired else "",
-                            show_url,
-                        ]
+                    yield (
+                        show.show_title,
+                        show.resolution or "",
+                        show.video_codec or "",
+                        season.season_number,
+                        ep.episode_code,
+                        ep.title or "",
+                        ep.tvdb_id,
+                        ep.aired.isoformat() if ep.aired else "",
+                        show_url,
                     )
 
-        return output.getvalue()
-
     def to_text(self, verbose: bool = False) -> None:
         """Output episode gap report as formatted text."""
+        console = get_console()
         console.print()
         console.print(f"[bold blue]TV Episode Gaps - {self.report.library_name}[/bold blue]")
         console.print()
@@ -417,27 +498,19 @@ class TVReportFormatter(ReportFormatter):
                 max_display = 5 if not verbose else len(season.missing_episodes)
                 displayed = season.missing_episodes[:max_display]
 
-                for ep in displayed:
-                    title_part = f" - {ep.title}" if ep.title else ""
-                    console.print(f"    {ep.episode_code}{title_part}")
-
+                # One print per season: each console.print is a full render pass
+                lines = [
+                    f"    {ep.episode_code}" + (f" - {ep.title}" if ep.title else "")
+                    for ep in displayed
+                ]
                 remaining = len(season.missing_episodes) - max_display
                 if remaining > 0:
-                    console.print(f"    [dim]... and {remaining} more[/dim]")
+                    lines.append(f"    [dim]... and {remaining} more[/dim]")
+                if lines:
+                    console.print("\n".join(lines))
 
             console.print()
 
-    def save_csv(self) -> Path:
-        """Save episode gap report as CSV file."""
-        safe_name = self._sanitize_filename(self.report.library_name)
-        filename = f"{safe_name}_tv_gaps_{date.today().isoformat()}.csv"
-        filepath = Path.cwd() / filename
-
-        with open(filepath, "w", newline="", encoding="utf-8") as f:
-            f.write(self.to_csv())
-
-        return filepath
-
     def show_summary(
         self,
         stats: ScanStatistics,
@@ -450,6 +523,7 @@ class TVReportFormatter(ReportFormatter):
 
         from complexionist.statistics import calculate_tv_score
 
+        console = get_console()
         # Calculate score
         score = calculate_tv_score(self.report.shows_with_gaps)
 
@@ -139,6 +139,7 @@ class PlexClient:
 
         self._timeout = timeout
         self._server: PlexServer | None = None
+        self._libraries: list[PlexLibrary] | None = None  # Sections, per connection
 
     def _normalize_url(self, url: str) -> str:
         """Normalize the Plex server URL."""
@@ -156,6 +157,7 @@ class PlexClient:
             PlexAuthError: If authentication fails.
             PlexConnectionError: If connection fails.
         """
+        self._libraries = None
         try:
             self._server = PlexServer(self.url, self.token, timeout=self._timeout)
         except Unauthorized as e:
@@ -216,13 +218,20 @@ class PlexClient:
     def get_libraries(self) -> list[PlexLibrary]:
         """Get all library sections.
 
+        Sections are fetched once per connection and reused, since scans look
+        them up repeatedly (library selection, then each gap finder). Call
+        `connect()` again to refresh.
+
         Returns:
             List of library sections.
         """
+        if self._libraries is not None:
+            return list(self._libraries)
+
         self._record_plex_api_call()
 
         sections = self.server.library.sections()
-        return [
+        self._libraries = [
             PlexLibrary(
                 key=str(section.key),
                 title=section.title,
@@ -231,6 +240,7 @@ class PlexClient:
             )
             for section in sections
         ]
+        return list(self._libraries)
 
     def get_movie_libraries(self) -> list[PlexLibrary]:
         """Get all movie libraries."""
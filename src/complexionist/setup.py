@@ -4,13 +4,9 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from rich.console import Console
-from rich.prompt import Confirm, Prompt
-
+from complexionist._console import get_console
 from complexionist.config import find_config_file, reset_config, save_default_config
 
-console = Console()
-
 
 def _prompt_url(prompt_text: str, default: str | None = None) -> str:
     """Prompt for a URL with validation.
@@ -22,6 +18,10 @@ def _prompt_url(prompt_text: str, default: str | None = None) -> str:
     Returns:
         Validated URL string.
     """
+    from rich.prompt import Prompt
+
+    console = get_console()
+
     while True:
         if default:
             value = Prompt.ask(prompt_text, default=default)
@@ -51,6 +51,10 @@ def _prompt_token(prompt_text: str, min_length: int = 10) -> str:
     Returns:
         Validated token string.
     """
+    from rich.prompt import Prompt
+
+    console = get_console()
+
     while True:
         value = Prompt.ask(prompt_text)
         value = value.strip()
@@ -153,8 +157,11 @@ def _prompt_and_test_plex() -> tuple[str, str]:
     Returns:
         Tuple of (url, token).
     """
+    from rich.prompt import Confirm
     from rich.status import Status
 
+    console = get_console()
+
     while True:
         plex_url = _prompt_url("Plex server URL", default="http://localhost:32400")
         plex_token = _prompt_token("Plex token", min_length=15)
@@ -181,8 +188,11 @@ def _prompt_and_test_tmdb() -> str:
     Returns:
         API key string.
     """
+    from rich.prompt import Confirm
     from rich.status import Status
 
+    console = get_console()
+
     while True:
         api_key = _prompt_token("TMDB API key", min_length=20)
 
@@ -207,8 +217,11 @@ def _prompt_and_test_tvdb() -> str:
     Returns:
         API key string.
     """
+    from rich.prompt import Confirm
     from rich.status import Status
 
+    console = get_console()
+
     while True:
         api_key = _prompt_token("TVDB API key", min_length=30)
 
@@ -247,6 +260,10 @@ def run_setup_wizard() -> Path | None:
     Returns:
         Path to created config file, or None if cancelled.
     """
+    from rich.prompt import Confirm
+
+    console = get_console()
+
     console.print()
     console.print("[bold blue]ComPlexionist Setup Wizard[/bold blue]")
     console.print()
@@ -334,6 +351,10 @@ def check_first_run() -> bool:
     if not detect_first_run():
         return True
 
+    from rich.prompt import Confirm
+
+    console = get_console()
+
     console.print()
     console.print("[yellow]No configuration file found.[/yellow]")
     console.print()
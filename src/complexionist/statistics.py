@@ -13,8 +13,14 @@ from datetime import timedelta
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from rich.console import Console
 
+# Clock used for all scan timings. Only differences between readings are used,
+# so a monotonic clock is immune to wall-clock adjustments; tests patch this.
+_now: Callable[[], float] = time.monotonic
+
 
 @dataclass
 class PhaseStats:
@@ -29,7 +35,7 @@ class PhaseStats:
     def duration(self) -> timedelta:
         """Get the duration of this phase."""
         if self.ended_at == 0:
-            return timedelta(seconds=time.time() - self.started_at)
+            return timedelta(seconds=_now() - self.started_at)
         return timedelta(seconds=self.ended_at - self.started_at)
 
     @property
@@ -83,12 +89,12 @@ class ScanStatistics:
 
     def start(self) -> None:
         """Start tracking the scan."""
-        self._started_at = time.time()
+        self._started_at = _now()
         ScanStatistics._instance = self
 
     def stop(self) -> None:
         """Stop tracking the scan."""
-        self._ended_at = time.time()
+        self._ended_at = _now()
         if self._current_phase:
             self.end_phase()
 
@@ -107,7 +113,7 @@ class ScanStatistics:
         """Get the total duration of the scan."""
         if self._started_at == 0:
             return timedelta(0)
-        end = self._ended_at if self._ended_at > 0 else time.time()
+        end = self._ended_at if self._ended_at > 0 else _now()
         return timedelta(seconds=end - self._started_at)
 
     @property
@@ -172,7 +178,7 @@ class ScanStatistics:
         """
         if self._current_phase:
             self.end_phase()
-        self._current_phase = PhaseStats(name=name, started_at=time.time())
+        self._current_phase = PhaseStats(name=name, started_at=_now())
 
     def end_phase(self, item_count: int = 0) -> None:
         """End the current phase.
@@ -181,7 +187,7 @@ class ScanStatistics:
             item_count: Number of items processed in this phase.
         """
         if self._current_phase:
-            self._current_phase.ended_at = time.time()
+            self._current_phase.ended_at = _now()
             self._current_phase.item_count = item_count
             self.phases.append(self._current_phase)
             self._current_phase = None
@@ -16,8 +16,6 @@ from complexionist.api import (
 )
 from complexionist.tmdb.models import (
     TMDBCollection,
-    TMDBCollectionInfo,
-    TMDBMovie,
     TMDBMovieDetails,
 )
 
@@ -85,6 +83,7 @@ class TMDBClient(BaseAPIClient):
             timeout=timeout,
             headers={"Accept": "application/json"},
             params={"api_key": self.api_key},
+            limits=self._http_limits,
         )
 
     def get_movie(self, movie_id: int) -> TMDBMovieDetails:
@@ -112,27 +111,11 @@ class TMDBClient(BaseAPIClient):
         self._record_cache_miss("tmdb", "tmdb_movie")
 
         response = self.client.get(f"/movie/{movie_id}")
-        data = self._handle_response(response)
-
-        # Parse the response
-        collection_data = data.get("belongs_to_collection")
-        collection_info: TMDBCollectionInfo | None = None
-        if collection_data:
-            collection_info = TMDBCollectionInfo(
-                id=collection_data["id"],
-                name=collection_data["name"],
-                poster_path=collection_data.get("poster_path"),
-                backdrop_path=collection_data.get("backdrop_path"),
-            )
+        self._raise_for_status(response)
 
         try:
-            result = TMDBMovieDetails(
-                id=data["id"],
-                title=data["title"],
-                release_date=self._parse_date(data.get("release_date")),
-                poster_path=data.get("poster_path"),
-                belongs_to_collection=collection_info,
-            )
+            # Parse and validate the raw body in one pass (unknown fields are ignored)
+            result = TMDBMovieDetails.model_validate_json(response.content)
 
             # Store in cache with TTL based on collection membership
             # Movies with collections rarely change, so use longer TTL (30 days)
@@ -158,6 +141,28 @@ class TMDBClient(BaseAPIClient):
         except ValidationError as e:
             raise TMDBError(f"Failed to parse movie response: {e}") from e
 
+    def get_movie_collection_id(self, movie_id: int) -> int | None:
+        """Get the ID of the collection a movie belongs to.
+
+        Collection grouping only needs this one field, so a cache hit reads
+        it straight from the cached dict instead of validating a full
+        TMDBMovieDetails. Misses go through get_movie(), which fills the cache.
+
+        Args:
+            movie_id: The TMDB movie ID.
+
+        Returns:
+            Collection ID if the movie belongs to one, None otherwise.
+        """
+        if self._cache:
+            cached = self._cache.get("tmdb", "movies", str(movie_id))
+            if cached:
+                self._record_cache_hit("tmdb")
+                collection = cached.get("belongs_to_collection")
+                return collection["id"] if collection else None
+
+        return self.get_movie(movie_id).collection_id
+
     def get_collection(self, collection_id: int) -> TMDBCollection:
         """Get a collection with all its movies.
 
@@ -180,27 +185,11 @@ class TMDBClient(BaseAPIClient):
         self._record_cache_miss("tmdb", "tmdb_collection")
 
         response = self.client.get(f"/collection/{collection_id}")
-        data = self._handle_response(response)
-
-        # Parse movies in the collection
-        movies = []
-        for part in data.get("parts", []):
-            movie = TMDBMovie(
-                id=part["id"],
-                title=part["title"],
-                release_date=self._parse_date(part.get("release_date")),
-                poster_path=part.get("poster_path"),
-            )
-            movies.append(movie)
+        self._raise_for_status(response)
 
         try:
-            result = TMDBCollection(
-                id=data["id"],
-                name=data["name"],
-                poster_path=data.get("poster_path"),
-                backdrop_path=data.get("backdrop_path"),
-                parts=movies,
-            )
+            # Parse and validate the raw body, parts included, in one pass
+            result = TMDBCollection.model_validate_json(response.content)
 
             # Store in cache
             if self._cache:
@@ -236,7 +225,7 @@ class TMDBClient(BaseAPIClient):
                 name=result["name"],
                 poster_path=result.get("poster_path"),
                 backdrop_path=result.get("backdrop_path"),
-                parts=[],  # Search results don't include parts
+                parts=(),  # Search results don't include parts
             )
             collections.append(collection)
 
@@ -1,8 +1,20 @@
 """Data models for TMDB API responses."""
 
 from datetime import date
+from typing import Annotated, Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, BeforeValidator
+
+from complexionist.api.helpers import parse_date
+
+
+def _parse_release_date(value: Any) -> Any:
+    """Map TMDB's date strings ("" for unknown) to a date or None."""
+    return parse_date(value) if isinstance(value, str) else value
+
+
+# TMDB sends "" for unknown release dates; treat those (and bad values) as None
+ReleaseDate = Annotated[date | None, BeforeValidator(_parse_release_date)]
 
 
 class TMDBMovie(BaseModel):
@@ -10,7 +22,7 @@ class TMDBMovie(BaseModel):
 
     id: int
     title: str
-    release_date: date | None = None
+    release_date: ReleaseDate = None
     poster_path: str | None = None
 
     @property
@@ -54,17 +66,16 @@ class TMDBCollection(BaseModel):
     name: str
     poster_path: str | None = None
     backdrop_path: str | None = None
-    parts: list[TMDBMovie] = Field(default_factory=list)
-
-    @property
-    def movie_count(self) -> int:
-        """Get the number of movies in the collection."""
-        return len(self.parts)
+    parts: tuple[TMDBMovie, ...] = ()
 
     @property
     def released_movies(self) -> list[TMDBMovie]:
         """Get only released movies."""
-        return [m for m in self.parts if m.is_released]
+        from complexionist.utils import is_date_past
+
+        # Read today's date once instead of once per movie
+        today = date.today()
+        return [m for m in self.parts if is_date_past(m.release_date, today=today)]
 
 
 class TMDBMovieDetails(BaseModel):
@@ -72,7 +83,7 @@ class TMDBMovieDetails(BaseModel):
 
     id: int
     title: str
-    release_date: date | None = None
+    release_date: ReleaseDate = None
     poster_path: str | None = None
     belongs_to_collection: TMDBCollectionInfo | None = None
 
@@ -105,6 +105,7 @@ class TVDBClient(BaseAPIClient):
                     "Accept": "application/json",
                     "Authorization": f"Bearer {self._token}",
                 },
+                limits=self._http_limits,
             )
         return self._client
 
@@ -1,5 +1,6 @@
 """Utility functions for ComPlexionist."""
 
+import random
 import time
 from collections.abc import Callable
 from datetime import date, timedelta
@@ -10,15 +11,22 @@ P = ParamSpec("P")
 T = TypeVar("T")
 
 
-def is_date_past(d: date | None) -> bool:
+def is_date_past(d: date | None, today: date | None = None) -> bool:
     """Check if a date is at least 1 day before today.
 
     Adds a 24-hour grace period because content released/aired "today"
     in one timezone may not be available for download until the next day.
+
+    Args:
+        d: Date to check (None counts as not past).
+        today: Reference date; pass one in when checking many dates in a loop.
+            Defaults to `date.today()`.
     """
     if d is None:
         return False
-    return d < date.today() - timedelta(days=1)
+    if today is None:
+        today = date.today()
+    return d < today - timedelta(days=1)
 
 
 def retry_with_backoff(
@@ -27,6 +35,7 @@ def retry_with_backoff(
     max_delay: float = 60.0,
     exponential_base: float = 2.0,
     retry_on: tuple[type[Exception], ...] = (Exception,),
+    jitter: float = 0.5,
 ) -> Callable[[Callable[P, T]], Callable[P, T]]:
     """Decorator that retries a function with exponential backoff.
 
@@ -36,11 +45,16 @@ def retry_with_backoff(
         max_delay: Maximum delay in seconds.
         exponential_base: Base for exponential backoff.
         retry_on: Tuple of exception types to retry on.
+        jitter: Random extra fraction of each delay (0.5 = up to +50%), so
+            concurrent callers that failed together don't retry in lockstep.
 
     Returns:
         Decorated function that retries on failure.
     """
 
+    # Un-jittered backoff for each retry, computed once per decorated function
+    backoff = [base_delay * exponential_base**attempt for attempt in range(max_retries)]
+
     def decorator(func: Callable[P, T]) -> Callable[P, T]:
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
@@ -55,12 +69,13 @@ def retry_with_backoff(
                     if attempt == max_retries:
                         break
 
-                    # Calculate delay with exponential backoff
-                    delay = min(base_delay * (exponential_base**attempt), max_delay)
+                    # Calculate delay with jittered exponential backoff
+                    delay = min(backoff[attempt] * (1 + random.uniform(0, jitter)), max_delay)
 
                     # Check if the exception has a retry_after attribute (rate limiting)
-                    if hasattr(e, "retry_after") and e.retry_after:
-                        delay = max(delay, e.retry_after)
+                    retry_after = getattr(e, "retry_after", None)
+                    if retry_after:
+                        delay = max(delay, retry_after + random.uniform(0, jitter))
 
                     time.sleep(delay)
 
@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
-from rich.console import Console
-
+from complexionist._console import get_console
 from complexionist.config import get_config
 
-console = Console()
+if TYPE_CHECKING:
+    from complexionist.config import AppConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionTestResult:
     """Result of testing connections to services."""
 
@@ -30,27 +33,34 @@ class ConnectionTestResult:
     tvdb_ok: bool = False
     tvdb_error: str | None = None
 
+    # Config the services were tested against (read once, not per property)
+    config: AppConfig = field(default_factory=get_config, repr=False, compare=False)
+
     @property
     def all_ok(self) -> bool:
-        """Check if all configured services connected successfully."""
-        return self.plex_ok and self.tmdb_ok and self.tvdb_ok
+        """Check if all configured services connected successfully.
+
+        TVDB is optional (validate_config() only warns when it's missing), so
+        an unconfigured TVDB doesn't count against the result.
+        """
+        return self.plex_ok and self.tmdb_ok and (self.tvdb_ok or not self.tvdb_configured)
 
     @property
     def plex_configured(self) -> bool:
         """Check if Plex is configured (even if connection failed)."""
-        cfg = get_config()
+        cfg = self.config
         return bool(cfg.plex.servers and cfg.plex.servers[0].url and cfg.plex.servers[0].token)
 
     @property
     def tmdb_configured(self) -> bool:
         """Check if TMDB is configured."""
-        cfg = get_config()
+        cfg = self.config
         return bool(cfg.tmdb.api_key)
 
     @property
     def tvdb_configured(self) -> bool:
         """Check if TVDB is configured."""
-        cfg = get_config()
+        cfg = self.config
         return bool(cfg.tvdb.api_key)
 
 
@@ -83,6 +93,10 @@ def test_connections(
 ) -> ConnectionTestResult:
     """Test connections to all configured services.
 
+    The services are independent, so they are probed concurrently and the
+    total wait is that of the slowest one. Each probe fills in only its own
+    fields of the result.
+
     Args:
         plex_url: Optional Plex URL override (for testing a specific server).
         plex_token: Optional Plex token override.
@@ -95,14 +109,13 @@ def test_connections(
     from complexionist.tvdb import TVDBClient, TVDBError
 
     cfg = get_config()
-    result = ConnectionTestResult()
+    result = ConnectionTestResult(config=cfg)
 
     # Use overrides or fall back to config
     url = plex_url or cfg.plex.url
     token = plex_token or cfg.plex.token
 
-    # Test Plex
-    if url and token:
+    def probe_plex() -> None:
         try:
             plex = PlexClient(url=url, token=token)
             plex.connect()
@@ -113,8 +126,7 @@ def test_connections(
         except PlexError as e:
             result.plex_error = str(e)
 
-    # Test TMDB
-    if cfg.tmdb.api_key:
+    def probe_tmdb() -> None:
         try:
             tmdb = TMDBClient()
             tmdb.test_connection()
@@ -122,8 +134,7 @@ def test_connections(
         except TMDBError as e:
             result.tmdb_error = str(e)
 
-    # Test TVDB
-    if cfg.tvdb.api_key:
+    def probe_tvdb() -> None:
         try:
             tvdb = TVDBClient()
             tvdb.login()
@@ -131,6 +142,22 @@ def test_connections(
         except TVDBError as e:
             result.tvdb_error = str(e)
 
+    # Only probe the services that are configured
+    probes: list[Callable[[], None]] = []
+    if url and token:
+        probes.append(probe_plex)
+    if cfg.tmdb.api_key:
+        probes.append(probe_tmdb)
+    if cfg.tvdb.api_key:
+        probes.append(probe_tvdb)
+
+    if probes:
+        with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+            futures = [executor.submit(probe) for probe in probes]
+            # Re-raise anything unexpected a probe didn't handle
+            for future in futures:
+                future.result()
+
     return result
 
 
@@ -145,53 +172,55 @@ def validate_config() -> bool:
     Returns:
         True if all configured services are valid, False otherwise.
     """
+    console = get_console()
     console.print("[bold]Validating Configuration[/bold]")
     console.print()
 
     result = test_connections()
     all_valid = True
+    # Collect the report and print it in one go
+    lines: list[str] = []
 
     # Show Plex status
-    console.print("Plex Server... ", end="")
     if not result.plex_configured:
-        console.print("[yellow]Not configured[/yellow]")
+        lines.append("Plex Server... [yellow]Not configured[/yellow]")
         all_valid = False
     elif result.plex_ok:
-        console.print(f"[green]OK[/green] ({result.plex_server_name})")
+        lines.append(f"Plex Server... [green]OK[/green] ({result.plex_server_name})")
         if result.movie_libraries:
-            console.print(f"  Movie libraries: {', '.join(result.movie_libraries)}")
+            lines.append(f"  Movie libraries: {', '.join(result.movie_libraries)}")
         if result.tv_libraries:
-            console.print(f"  TV libraries: {', '.join(result.tv_libraries)}")
+            lines.append(f"  TV libraries: {', '.join(result.tv_libraries)}")
     else:
-        console.print(f"[red]Failed[/red] - {result.plex_error}")
+        lines.append(f"Plex Server... [red]Failed[/red] - {result.plex_error}")
         all_valid = False
 
     # Show TMDB status
-    console.print("TMDB API... ", end="")
     if not result.tmdb_configured:
-        console.print("[yellow]Not configured[/yellow]")
+        lines.append("TMDB API... [yellow]Not configured[/yellow]")
         all_valid = False
     elif result.tmdb_ok:
-        console.print("[green]OK[/green]")
+        lines.append("TMDB API... [green]OK[/green]")
     else:
-        console.print(f"[red]Failed[/red] - {result.tmdb_error}")
+        lines.append(f"TMDB API... [red]Failed[/red] - {result.tmdb_error}")
         all_valid = False
 
     # Show TVDB status
-    console.print("TVDB API... ", end="")
     if not result.tvdb_configured:
-        console.print("[yellow]Not configured[/yellow] (TV show gaps won't be detected)")
+        lines.append("TVDB API... [yellow]Not configured[/yellow] (TV show gaps won't be detected)")
     elif result.tvdb_ok:
-        console.print("[green]OK[/green]")
+        lines.append("TVDB API... [green]OK[/green]")
     else:
-        console.print(f"[red]Failed[/red] - {result.tvdb_error}")
+        lines.append(f"TVDB API... [red]Failed[/red] - {result.tvdb_error}")
         all_valid = False
 
-    console.print()
+    lines.append("")
     if all_valid:
-        console.print("[green]Configuration is valid![/green]")
+        lines.append("[green]Configuration is valid![/green]")
     else:
-        console.print("[yellow]Some services are not configured or failed validation.[/yellow]")
+        lines.append("[yellow]Some services are not configured or failed validation.[/yellow]")
+
+    console.print("\n".join(lines))
 
     return all_valid
 
@@ -2,9 +2,12 @@
 
 import json
 import tempfile
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
 from pathlib import Path
 
+import pytest
+
+from complexionist import cache as cache_module
 from complexionist.cache import (
     TMDB_COLLECTION_TTL_HOURS,
     TMDB_MOVIE_WITH_COLLECTION_TTL_HOURS,
@@ -13,9 +16,12 @@ from complexionist.cache import (
     Cache,
     CacheStats,
     LibraryFingerprint,
+    SqliteCache,
     compute_fingerprint,
+    create_cache,
     get_cache_dir,
 )
+from complexionist.config import AppConfig, CacheConfig
 from complexionist.plex import PlexMovie
 
 
@@ -48,6 +54,14 @@ class TestCacheDefaults:
         # Should return a valid parent directory
         assert cache_dir.exists() or cache_dir.parent.exists()
 
+    def test_cache_dir_env_override(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test COMPLEXIONIST_CACHE_DIR overrides the cache location."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            monkeypatch.setenv("COMPLEXIONIST_CACHE_DIR", tmpdir)
+
+            assert get_cache_dir() == Path(tmpdir)
+            assert Cache().cache_file == Path(tmpdir) / "complexionist.cache.json"
+
 
 class TestCacheStats:
     """Tests for CacheStats dataclass."""
@@ -99,6 +113,39 @@ class TestCacheInit:
         cache = Cache(enabled=False)
         assert cache.enabled is False
 
+    def test_durable_save(self) -> None:
+        """Test durable mode writes a readable cache file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = Cache(cache_dir=Path(tmpdir), durable=True)
+            cache.set("tmdb", "movies", "123", {"id": 123}, ttl_hours=24)
+            cache.flush()
+
+            assert not list(Path(tmpdir).glob("*.tmp"))
+            reloaded = Cache(cache_dir=Path(tmpdir))
+            assert reloaded.get("tmdb", "movies", "123") == {"id": 123}
+
+    def test_compress_without_zstandard(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test compress falls back to plain JSON when zstandard is missing."""
+        monkeypatch.setattr(cache_module, "_HAS_ZSTD", False)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = Cache(cache_dir=Path(tmpdir), compress=True)
+
+            assert cache.compress is False
+            assert cache.cache_file.name == "complexionist.cache.json"
+
+    def test_compressed_round_trip(self) -> None:
+        """Test a zstd-compressed cache file can be written and read back."""
+        pytest.importorskip("zstandard")
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = Cache(cache_dir=Path(tmpdir), compress=True)
+            cache.set("tmdb", "movies", "123", {"id": 123}, ttl_hours=24)
+            cache.flush()
+
+            assert cache.cache_file.name == "complexionist.cache.json.zst"
+            assert not cache.cache_file.read_bytes().startswith(b"{")
+            reloaded = Cache(cache_dir=Path(tmpdir), compress=True)
+            assert reloaded.get("tmdb", "movies", "123") == {"id": 123}
+
 
 class TestCacheGetSet:
     """Tests for Cache get/set operations."""
@@ -198,8 +245,51 @@ class TestCacheGetSet:
             assert entry["_cache_meta"]["ttl_hours"] == 168
             assert "cached_at" in entry["_cache_meta"]
             assert "expires_at" in entry["_cache_meta"]
+            assert (
+                entry["_cache_meta"]["expires_at_epoch"]
+                == datetime.fromisoformat(entry["_cache_meta"]["expires_at"]).timestamp()
+            )
             assert entry["data"] == data
 
+    def test_stdlib_json_fallback(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test cache round-trips when orjson is not installed."""
+        monkeypatch.setattr(cache_module, "_HAS_ORJSON", False)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = Cache(cache_dir=Path(tmpdir))
+            cache.set("tmdb", "movies", "123", {"id": 123, "title": "Test"}, ttl_hours=24)
+            cache.flush()
+
+            # Written compactly, without indentation
+            assert b"\n" not in cache.cache_file.read_bytes()
+
+            # Fresh instance reads the file written by the stdlib encoder
+            reloaded = Cache(cache_dir=Path(tmpdir))
+            assert reloaded.get("tmdb", "movies", "123") == {"id": 123, "title": "Test"}
+
+    def test_json_default_encoder(self) -> None:
+        """Test only dates and paths are encoded; other types raise."""
+        encoded = cache_module._json_dumps(
+            {"when": date(2025, 1, 25), "path": Path("a") / "b", "n": 1}
+        )
+        decoded = cache_module._json_loads(encoded)
+        assert decoded["when"] == "2025-01-25"
+        assert decoded["path"] == str(Path("a") / "b")
+
+        with pytest.raises(TypeError):
+            cache_module._json_dumps({"bad": object()})
+
+    def test_unserializable_data_is_not_stored(self, tmp_path: Path) -> None:
+        """Test a value the encoder rejects is skipped without blocking other saves."""
+        cache = Cache(cache_dir=tmp_path)
+        cache.set("tmdb", "movies", "1", {"bad": object()}, ttl_hours=24)
+        cache.set("tmdb", "movies", "2", {"id": 2}, ttl_hours=24)
+        cache.flush()
+
+        assert cache.pending_changes == 0
+        reloaded = Cache(cache_dir=tmp_path)
+        assert reloaded.get("tmdb", "movies", "1") is None
+        assert reloaded.get("tmdb", "movies", "2") == {"id": 2}
+
     def test_corrupted_cache_file(self) -> None:
         """Test corrupted cache file is handled gracefully."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -557,3 +647,129 @@ class TestCacheFingerprints:
 
             # Cache should be empty
             assert cache.stats().total_entries == 0
+
+
+class TestSqliteCache:
+    """Tests for the SQLite cache backend."""
+
+    def test_set_and_get(self) -> None:
+        """Test entries round-trip through the database."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = SqliteCache(cache_dir=Path(tmpdir))
+            cache.set("tmdb", "movies", "123", {"id": 123, "title": "Test"}, ttl_hours=24)
+            cache.close()
+
+            assert (Path(tmpdir) / "complexionist.cache.db").exists()
+            reloaded = SqliteCache(cache_dir=Path(tmpdir))
+            assert reloaded.get("tmdb", "movies", "123") == {"id": 123, "title": "Test"}
+            assert reloaded.get("tmdb", "movies", "999") is None
+            reloaded.close()
+
+    def test_context_manager_closes_connection(self, tmp_path: Path) -> None:
+        """Test leaving a with block commits and closes the database."""
+        with SqliteCache(cache_dir=tmp_path) as cache:
+            cache.set("tmdb", "movies", "1", {"id": 1}, ttl_hours=24)
+
+        assert cache._conn is None
+        with SqliteCache(cache_dir=tmp_path) as reloaded:
+            assert reloaded.get("tmdb", "movies", "1") == {"id": 1}
+
+    def test_expired_entries(self) -> None:
+        """Test expired entries are hidden, counted and cleaned up."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = SqliteCache(cache_dir=Path(tmpdir))
+            cache.set("tmdb", "movies", "1", {"id": 1}, ttl_hours=-1)
+            cache.set("tmdb", "movies", "2", {"id": 2}, ttl_hours=24)
+
+            assert cache.get_expired_count() == 1
+            assert cache.cleanup_expired() == 1
+            assert cache.get("tmdb", "movies", "1") is None
+            assert cache.get("tmdb", "movies", "2") == {"id": 2}
+            cache.close()
+
+    def test_stats_and_clear(self) -> None:
+        """Test stats counts by category and clear by namespace."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = SqliteCache(cache_dir=Path(tmpdir))
+            cache.set("tmdb", "movies", "1", {"id": 1}, ttl_hours=24)
+            cache.set("tmdb", "collections", "2", {"id": 2}, ttl_hours=24)
+            cache.set("tvdb", "episodes", "3", {"id": 3}, ttl_hours=24)
+            cache.flush()
+
+            stats = cache.stats()
+            assert stats.total_entries == 3
+            assert stats.tmdb_movies == 1
+            assert stats.tmdb_collections == 1
+            assert stats.tvdb_episodes == 1
+            assert stats.oldest_entry is not None
+            assert stats.total_size_bytes > 0
+
+            assert cache.clear(namespace="tmdb") == 2
+            assert cache.stats().total_entries == 1
+            cache.close()
+
+    def test_fingerprints_and_refresh(self) -> None:
+        """Test fingerprint storage and refresh clearing everything."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache = SqliteCache(cache_dir=Path(tmpdir))
+            fingerprint = compute_fingerprint([PlexMovie(rating_key="100", title="Movie A")])
+            cache.set_library_fingerprint("Movies", fingerprint)
+            cache.set("tmdb", "movies", "100", {"id": 100}, ttl_hours=24)
+
+            assert cache.check_fingerprint("Movies", fingerprint)
+            assert cache.refresh() == 1
+            assert cache.get_library_fingerprint("Movies") is None
+            cache.close()
+
+    def test_unserializable_data_is_not_stored(self, tmp_path: Path) -> None:
+        """Test a value the encoder rejects is skipped instead of raising."""
+        cache = SqliteCache(cache_dir=tmp_path)
+        cache.set("tmdb", "movies", "1", {"bad": object()}, ttl_hours=24)
+        assert cache.get("tmdb", "movies", "1") is None
+        cache.close()
+
+    def test_stats_include_wal_file(self, tmp_path: Path) -> None:
+        """Test reported size covers uncheckpointed WAL data, not just the main file."""
+        cache = SqliteCache(cache_dir=tmp_path)
+        cache.set("tmdb", "movies", "1", {"id": 1, "title": "x" * 4096}, ttl_hours=24)
+        cache.flush()
+
+        wal_file = tmp_path / "complexionist.cache.db-wal"
+        assert wal_file.exists()
+        main_size = (tmp_path / "complexionist.cache.db").stat().st_size
+        assert cache.stats().total_size_bytes >= main_size + wal_file.stat().st_size
+        cache.close()
+
+
+class TestCreateCache:
+    """Tests for choosing the cache backend from config."""
+
+    @pytest.mark.parametrize(("backend", "expected"), [("json", Cache), ("sqlite", SqliteCache)])
+    def test_backend_from_config(
+        self,
+        backend: str,
+        expected: type[Cache],
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test create_cache() builds the backend named in the [cache] section."""
+        config = AppConfig(cache=CacheConfig(backend=backend))
+        monkeypatch.setattr("complexionist.config.get_config", lambda: config)
+        monkeypatch.setenv("COMPLEXIONIST_CACHE_DIR", str(tmp_path))
+
+        cache = create_cache()
+        assert type(cache) is expected
+        assert cache.cache_dir == tmp_path
+
+    def test_json_options_from_config(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the JSON backend receives the configured compress/durable flags."""
+        config = AppConfig(cache=CacheConfig(compress=True, durable=True))
+        monkeypatch.setattr("complexionist.config.get_config", lambda: config)
+        monkeypatch.setenv("COMPLEXIONIST_CACHE_DIR", str(tmp_path))
+
+        cache = create_cache()
+        assert cache.durable is True
+        # Compression silently stays off without the optional zstandard package
+        assert cache.compress is cache_module._HAS_ZSTD
@@ -1,11 +1,19 @@
 """Tests for the CLI module."""
 
 import re
+import subprocess
+import sys
+from datetime import date
+from typing import Any
+from unittest.mock import MagicMock
 
+import pytest
 from click.testing import CliRunner
 
 from complexionist import __version__
-from complexionist.cli import main
+from complexionist.cli import _ProgressUpdater, main
+from complexionist.gaps import CollectionGap, MissingMovie, MovieGapReport
+from complexionist.output import MovieReportFormatter
 
 
 def test_main_help() -> None:
@@ -26,6 +34,15 @@ def test_version() -> None:
     assert __version__ in result.output
 
 
+def test_import_does_not_load_rich() -> None:
+    """Test that importing the CLI defers loading Rich until output is needed."""
+    code = "import sys, complexionist.cli; print('rich' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
+
+
 def test_movies_command_exists() -> None:
     """Test that the movies command exists."""
     runner = CliRunner()
@@ -56,3 +73,69 @@ def test_config_path() -> None:
     result = runner.invoke(main, ["config", "path"])
     assert result.exit_code == 0
     assert ".complexionist" in result.output
+
+
+def test_progress_updater_throttles() -> None:
+    """Test progress updates are throttled except for stage changes and completion."""
+    updates: list[tuple[str, int, int]] = []
+
+    class FakeProgress:
+        def update(self, task: int, description: str, completed: int, total: int) -> None:
+            updates.append((description, completed, total))
+
+    callback = _ProgressUpdater(FakeProgress(), 1, min_interval=60.0)
+    callback("Loading", 1, 10)
+    callback("Loading", 2, 10)  # Throttled
+    callback("Loading", 10, 10)  # Stage complete
+    callback("Checking", 1, 5)  # New stage
+
+    assert updates == [("Loading", 1, 10), ("Loading", 10, 10), ("Checking", 1, 5)]
+
+
+def test_movies_csv_format_uses_lf_line_endings(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that --format csv writes plain LF rows to stdout (no CR from csv.writer)."""
+    report = MovieGapReport(
+        library_name="Movies",
+        total_movies_scanned=1,
+        movies_with_tmdb_id=1,
+        movies_in_collections=1,
+        unique_collections=1,
+        collections_with_gaps=[
+            CollectionGap(
+                collection_id=8091,
+                collection_name="Alien Collection",
+                total_movies=2,
+                owned_movies=1,
+                missing_movies=[
+                    MissingMovie(
+                        tmdb_id=679, title="Aliens", year=1986, release_date=date(1986, 7, 18)
+                    )
+                ],
+            )
+        ],
+    )
+
+    class FakeFinder:
+        def __init__(self, **kwargs: Any) -> None:
+            pass
+
+        def find_gaps(self, library_name: str) -> MovieGapReport:
+            return report
+
+    monkeypatch.setattr("complexionist.cli._show_splash", lambda: None)
+    monkeypatch.setattr("complexionist.cli._load_modules", lambda: None)
+    monkeypatch.setattr("complexionist.cli._check_config_exists", lambda: None)
+    monkeypatch.setattr("complexionist.cli._get_cache", lambda ctx: MagicMock())
+    monkeypatch.setattr("complexionist.cli._connect_plex", lambda ctx, server: MagicMock())
+    monkeypatch.setattr("complexionist.cli._resolve_libraries", lambda *args: ["Movies"])
+    monkeypatch.setattr("complexionist.tmdb.TMDBClient", MagicMock())
+    monkeypatch.setattr("complexionist.gaps.MovieGapFinder", FakeFinder)
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["-q", "movies", "--format", "csv"])
+
+    assert result.exit_code == 0, result.output
+    expected_header = ",".join(MovieReportFormatter(report).csv_header)
+    assert b"\r" not in result.stdout_bytes
+    assert result.stdout_bytes.startswith(expected_header.encode() + b"\n")
+    assert result.stdout_bytes.count(b"\n") == 2
@@ -5,6 +5,7 @@ import tempfile
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 from complexionist.config import (
     _HAS_YAML,
@@ -15,8 +16,14 @@ from complexionist.config import (
     TMDBConfig,
     TVDBConfig,
     _expand_env_vars,
+    add_ignored_collection,
+    add_ignored_show,
+    find_config_file,
+    get_config,
     get_config_paths,
     load_config,
+    remove_ignored_collection,
+    remove_ignored_show,
     reset_config,
     save_default_config,
 )
@@ -54,8 +61,8 @@ class TestConfigModels:
     def test_exclusions_config_defaults(self) -> None:
         """Test ExclusionsConfig has correct defaults."""
         cfg = ExclusionsConfig()
-        assert cfg.shows == []
-        assert cfg.collections == []
+        assert cfg.shows == ()
+        assert cfg.collections == ()
 
     def test_app_config_defaults(self) -> None:
         """Test AppConfig has correct defaults."""
@@ -66,6 +73,12 @@ class TestConfigModels:
         assert isinstance(cfg.options, OptionsConfig)
         assert isinstance(cfg.exclusions, ExclusionsConfig)
 
+    def test_config_models_are_frozen(self) -> None:
+        """Test that loaded config models reject attribute assignment."""
+        cfg = AppConfig()
+        with pytest.raises(ValidationError):
+            cfg.options.min_owned = 5  # type: ignore[misc]
+
 
 class TestEnvVarExpansion:
     """Tests for environment variable expansion."""
@@ -122,6 +135,43 @@ class TestConfigLoading:
         assert isinstance(cfg, AppConfig)
         assert cfg.options.min_collection_size == 2
 
+    def test_unchanged_file_reuses_validated_config(self, tmp_path: Path) -> None:
+        """Test that reloading an unchanged file skips re-validation."""
+        config_path = tmp_path / "complexionist.ini"
+        config_path.write_text("[options]\nmin_collection_size = 3\n", encoding="utf-8")
+
+        reset_config()
+        try:
+            first = load_config(config_path)
+            assert load_config(config_path) is first
+
+            config_path.write_text("[options]\nmin_collection_size = 12\n", encoding="utf-8")
+            reloaded = load_config(config_path)
+            assert reloaded is not first
+            assert reloaded.options.min_collection_size == 12
+
+            # The reset-then-load reload path still reuses an unchanged file
+            reset_config()
+            assert load_config(config_path) is reloaded
+        finally:
+            reset_config()
+
+    def test_changed_env_var_invalidates_validated_config(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a changed ${VAR} value is picked up for an unchanged file."""
+        config_path = tmp_path / "complexionist.ini"
+        config_path.write_text("[tmdb]\napi_key = ${MY_KEY}\n", encoding="utf-8")
+        monkeypatch.setenv("MY_KEY", "first")
+
+        reset_config()
+        try:
+            assert load_config(config_path).tmdb.api_key == "first"
+            monkeypatch.setenv("MY_KEY", "second")
+            assert load_config(config_path).tmdb.api_key == "second"
+        finally:
+            reset_config()
+
     @pytest.mark.skipif(not _HAS_YAML, reason="PyYAML not installed")
     def test_load_from_file(self) -> None:
         """Test loading configuration from YAML file."""
@@ -223,6 +273,25 @@ collections = Anthology
         finally:
             temp_path.unlink()
 
+    def test_load_ini_cache_backend(self, tmp_path: Path) -> None:
+        """Test the [cache] section is read, and unknown backends fall back to json."""
+        config_path = tmp_path / "complexionist.ini"
+        config_path.write_text(
+            "[cache]\nbackend = SQLite\ncompress = yes\ndurable = true\n", encoding="utf-8"
+        )
+        reset_config()
+        try:
+            cache_config = load_config(config_path).cache
+            assert cache_config.backend == "sqlite"
+            assert cache_config.compress is True
+            assert cache_config.durable is True
+
+            config_path.write_text("[cache]\nbackend = redis\n", encoding="utf-8")
+            reset_config()
+            assert load_config(config_path).cache.backend == "json"
+        finally:
+            reset_config()
+
     def test_load_ini_partial_config(self) -> None:
         """Test loading partial INI config uses defaults for missing values."""
         config_content = """
@@ -267,10 +336,89 @@ class TestConfigPaths:
         home = Path.home()
         assert any(str(home) in str(p) for p in paths)
 
+    def test_find_config_file_cleared_on_save(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a newly saved config is found despite the cached lookup."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(Path, "home", lambda: tmp_path / "home")
+        reset_config()
+        try:
+            assert find_config_file() is None
+            saved = save_default_config(tmp_path / "complexionist.ini")
+            assert find_config_file() == saved
+        finally:
+            reset_config()
+
+    def test_find_config_file_prefers_ini(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that the search keeps its priority order and ignores directories."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(Path, "home", lambda: tmp_path / "home")
+        (tmp_path / "config.yml").write_text("options: {}\n", encoding="utf-8")
+        (tmp_path / "complexionist.ini").mkdir()
+        reset_config()
+        try:
+            expected = tmp_path / "config.yml" if _HAS_YAML else None
+            assert find_config_file() == expected
+
+            (tmp_path / "complexionist.ini").rmdir()
+            (tmp_path / "complexionist.ini").write_text("[options]\n", encoding="utf-8")
+            reset_config()
+            assert find_config_file() == tmp_path / "complexionist.ini"
+        finally:
+            reset_config()
+
+
+class TestIgnoredLists:
+    """Tests for the GUI-managed ignore lists."""
+
+    def test_add_and_remove_ignored_ids(self, tmp_path: Path) -> None:
+        """Test ignore list changes replace the frozen config and persist to the file."""
+        config_path = tmp_path / "complexionist.ini"
+        config_path.write_text("[tmdb]\nignored_collections = 8091\n", encoding="utf-8")
+        reset_config()
+        try:
+            original = load_config(config_path)
+
+            assert add_ignored_collection(748)
+            assert not add_ignored_collection(748)
+            assert add_ignored_show(71663)
+            assert get_config().tmdb.ignored_collections == (8091, 748)
+            assert get_config().tvdb.ignored_shows == (71663,)
+            # The previously loaded model is untouched
+            assert original.tmdb.ignored_collections == (8091,)
+
+            assert remove_ignored_collection(8091)
+            assert remove_ignored_show(71663)
+            assert not remove_ignored_show(71663)
+
+            reset_config()
+            reloaded = load_config(config_path)
+            assert reloaded.tmdb.ignored_collections == (748,)
+            assert reloaded.tvdb.ignored_shows == ()
+        finally:
+            reset_config()
+
 
 class TestDefaultConfig:
     """Tests for default config generation."""
 
+    def test_save_default_config_refreshes_get_config(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that get_config() picks up a newly saved default config."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(Path, "home", lambda: tmp_path / "home")
+        reset_config()
+        try:
+            assert get_config().tmdb.api_key is None
+            save_default_config(tmp_path / "complexionist.ini", tmdb_api_key="new-key")
+            assert get_config().tmdb.api_key == "new-key"
+        finally:
+            reset_config()
+
     def test_save_default_config(self) -> None:
         """Test saving default INI config creates valid file."""
         import configparser
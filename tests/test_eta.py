@@ -60,6 +60,9 @@ class TestFormatSeconds:
     def test_negative_clamps_to_zero(self):
         assert _format_seconds(-5) == "~1s remaining"
 
+    def test_just_under_a_minute_rolls_over(self):
+        assert _format_seconds(59.8) == "~1m remaining"
+
 
 class TestETACalculator:
     """Tests for ETACalculator."""
@@ -1,8 +1,13 @@
 """Tests for the gap detection module."""
 
+from collections.abc import Callable
 from datetime import date, timedelta
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import MagicMock
 
+import pytest
+
 from complexionist.gaps import (
     CollectionGap,
     EpisodeGapFinder,
@@ -20,26 +25,141 @@ from complexionist.plex import PlexEpisode, PlexMovie, PlexShow
 from complexionist.tmdb import TMDBCollection, TMDBMovie, TMDBMovieDetails
 from complexionist.tvdb import TVDBEpisode
 
+# Library stubs returned by the fake Plex clients; the gap finders only read them.
+_MOVIES_LIBRARY_LIST = [SimpleNamespace(title="Movies", locations=[])]
+_TV_LIBRARY_LIST = [SimpleNamespace(title="TV Shows")]
+
+
+class FakePlex:
+    """Plain stand-in for PlexClient serving a fixed movie list."""
+
+    def __init__(self, movies: list[PlexMovie]) -> None:
+        self._movies = movies
+
+    def get_movies(
+        self,
+        library_name: str | None = None,
+        progress_callback: Callable[[str, int, int], None] | None = None,
+    ) -> list[PlexMovie]:
+        return self._movies
+
+    def get_movie_libraries(self) -> list[SimpleNamespace]:
+        return _MOVIES_LIBRARY_LIST
+
+
+class FakeCache:
+    """Cache stub that reports every movie as cached, so lookups skip the stagger."""
+
+    def get(self, *key: str) -> dict[str, Any]:
+        return {}
+
+
+class FakeTMDB:
+    """Plain stand-in for TMDBClient backed by dicts."""
+
+    def __init__(
+        self,
+        movie_collections: dict[int, int | None],
+        collections: dict[int, TMDBCollection],
+    ) -> None:
+        self._movie_collections = movie_collections
+        self._collections = collections
+        self._cache = FakeCache()
+        # Built once up front so lookups don't construct models per call
+        self._movie_details = {
+            movie_id: TMDBMovieDetails(
+                id=movie_id,
+                title=f"Movie {movie_id}",
+                belongs_to_collection=(
+                    {"id": collection_id, "name": f"Collection {collection_id}"}
+                    if collection_id
+                    else None
+                ),
+            )
+            for movie_id, collection_id in movie_collections.items()
+        }
+
+    def get_movie(self, movie_id: int) -> TMDBMovieDetails:
+        return self._movie_details[movie_id]
+
+    def get_movie_collection_id(self, movie_id: int) -> int | None:
+        return self._movie_collections.get(movie_id)
+
+    def get_collection(self, collection_id: int) -> TMDBCollection:
+        return self._collections[collection_id]
+
+
+PAST_DATE = date(2020, 1, 1)
+FUTURE_DATE = date(2099, 12, 31)
+
+MOVIE_1 = TMDBMovie(id=100, title="Movie 1", release_date=PAST_DATE)
+MOVIE_2 = TMDBMovie(id=101, title="Movie 2", release_date=date(2021, 1, 1))
+MOVIE_3 = TMDBMovie(id=102, title="Movie 3", release_date=date(2022, 1, 1))
+TWO_MOVIE_PARTS = (MOVIE_1, MOVIE_2)
+
+# Shared collections; MovieGapFinder only reads them, so tests can reuse one instance.
+TWO_MOVIE_COLLECTION = TMDBCollection(id=1, name="Test Collection", parts=TWO_MOVIE_PARTS)
+THREE_MOVIE_COLLECTION = TMDBCollection(
+    id=1, name="Test Collection", parts=(MOVIE_1, MOVIE_2, MOVIE_3)
+)
+FUTURE_COLLECTION = TMDBCollection(
+    id=1,
+    name="Test Collection",
+    parts=(
+        TMDBMovie(id=100, title="Released Movie", release_date=PAST_DATE),
+        TMDBMovie(id=101, title="Future Movie", release_date=FUTURE_DATE),
+    ),
+)
+ALIEN_COLLECTION = TMDBCollection(
+    id=8091,
+    name="Alien Collection",
+    parts=(
+        TMDBMovie(id=348, title="Alien", release_date=date(1979, 5, 25)),
+        TMDBMovie(id=679, title="Aliens", release_date=date(1986, 7, 18)),
+        TMDBMovie(id=8077, title="Alien 3", release_date=date(1992, 5, 22)),
+    ),
+)
+
+
+# Shared gaps for the report-level count tests
+TWO_MISSING_GAP = CollectionGap(
+    collection_id=1,
+    collection_name="Collection 1",
+    total_movies=5,
+    owned_movies=3,
+    missing_movies=[
+        MissingMovie(tmdb_id=1, title="Movie 1"),
+        MissingMovie(tmdb_id=2, title="Movie 2"),
+    ],
+)
+ONE_MISSING_GAP = CollectionGap(
+    collection_id=2,
+    collection_name="Collection 2",
+    total_movies=3,
+    owned_movies=2,
+    missing_movies=[MissingMovie(tmdb_id=3, title="Movie 3")],
+)
+DISORGANIZED_GAP = CollectionGap(
+    collection_id=3,
+    collection_name="Disorganized",
+    total_movies=3,
+    owned_movies=3,
+    missing_movies=[],
+    is_complete=True,
+)
+
 
 class TestGapModels:
     """Tests for gap detection data models."""
 
-    def test_missing_movie_display_title_with_year(self) -> None:
-        """Test display title includes year when available."""
-        movie = MissingMovie(
-            tmdb_id=123,
-            title="Test Movie",
-            year=2020,
-        )
-        assert movie.display_title == "Test Movie (2020)"
-
-    def test_missing_movie_display_title_without_year(self) -> None:
-        """Test display title without year."""
-        movie = MissingMovie(
-            tmdb_id=123,
-            title="Test Movie",
-        )
-        assert movie.display_title == "Test Movie"
+    @pytest.mark.parametrize(
+        ("year", "expected"),
+        [(2020, "Test Movie (2020)"), (None, "Test Movie")],
+    )
+    def test_missing_movie_display_title(self, year: int | None, expected: str) -> None:
+        """Test display title includes year only when available."""
+        movie = MissingMovie(tmdb_id=123, title="Test Movie", year=year)
+        assert movie.display_title == expected
 
     def test_owned_movie_display_title_with_media_info(self) -> None:
         """Test owned movie display title is just title+year (badges are separate)."""
@@ -108,109 +228,50 @@ class TestGapModels:
         )
         assert gap.missing_count == 2
 
-    def test_collection_gap_completion_percent(self) -> None:
-        """Test completion percentage calculation."""
+    @pytest.mark.parametrize(
+        ("total", "owned", "missing", "expected"),
+        [(4, 3, 1, 75.0), (0, 0, 0, 100.0)],
+    )
+    def test_collection_gap_completion_percent(
+        self, total: int, owned: int, missing: int, expected: float
+    ) -> None:
+        """Test completion percentage, including a collection with zero movies."""
         gap = CollectionGap(
             collection_id=1,
             collection_name="Test Collection",
-            total_movies=4,
-            owned_movies=3,
-            missing_movies=[MissingMovie(tmdb_id=1, title="Movie 1")],
-        )
-        assert gap.completion_percent == 75.0
-
-    def test_collection_gap_completion_percent_empty(self) -> None:
-        """Test completion percentage with zero total movies."""
-        gap = CollectionGap(
-            collection_id=1,
-            collection_name="Empty Collection",
-            total_movies=0,
-            owned_movies=0,
-            missing_movies=[],
-        )
-        assert gap.completion_percent == 100.0
-
-    def test_movie_gap_report_total_missing(self) -> None:
-        """Test total missing count across collections."""
-        report = MovieGapReport(
-            library_name="Movies",
-            total_movies_scanned=100,
-            movies_with_tmdb_id=95,
-            movies_in_collections=50,
-            unique_collections=10,
-            collections_with_gaps=[
-                CollectionGap(
-                    collection_id=1,
-                    collection_name="Collection 1",
-                    total_movies=5,
-                    owned_movies=3,
-                    missing_movies=[
-                        MissingMovie(tmdb_id=1, title="Movie 1"),
-                        MissingMovie(tmdb_id=2, title="Movie 2"),
-                    ],
-                ),
-                CollectionGap(
-                    collection_id=2,
-                    collection_name="Collection 2",
-                    total_movies=3,
-                    owned_movies=2,
-                    missing_movies=[
-                        MissingMovie(tmdb_id=3, title="Movie 3"),
-                    ],
-                ),
-            ],
-        )
-        assert report.total_missing == 3
-
-    def test_movie_gap_report_complete_collections(self) -> None:
-        """Test count of complete collections."""
-        report = MovieGapReport(
-            library_name="Movies",
-            total_movies_scanned=100,
-            movies_with_tmdb_id=95,
-            movies_in_collections=50,
-            unique_collections=10,
-            collections_with_gaps=[
-                CollectionGap(
-                    collection_id=1,
-                    collection_name="Collection 1",
-                    total_movies=5,
-                    owned_movies=3,
-                    missing_movies=[MissingMovie(tmdb_id=1, title="Movie 1")],
-                ),
+            total_movies=total,
+            owned_movies=owned,
+            missing_movies=[
+                MissingMovie(tmdb_id=i, title=f"Movie {i}") for i in range(1, missing + 1)
             ],
         )
-        # 10 total - 1 with gaps = 9 complete
-        assert report.complete_collections == 9
-
-    def test_complete_collections_with_disorganized(self) -> None:
-        """Test complete_collections count includes disorganized as complete."""
+        assert gap.completion_percent == expected
+
+    @pytest.mark.parametrize(
+        ("gaps", "attr", "expected"),
+        [
+            # Missing movies are summed across collections
+            ((TWO_MISSING_GAP, ONE_MISSING_GAP), "total_missing", 3),
+            # 10 total - 1 with gaps = 9 complete
+            ((ONE_MISSING_GAP,), "complete_collections", 9),
+            # Disorganized collections still count as complete
+            ((ONE_MISSING_GAP, DISORGANIZED_GAP), "complete_collections", 9),
+        ],
+        ids=["total_missing", "complete_collections", "complete_with_disorganized"],
+    )
+    def test_movie_gap_report_counts(
+        self, gaps: tuple[CollectionGap, ...], attr: str, expected: int
+    ) -> None:
+        """Test report-level counts derived from the collection gaps."""
         report = MovieGapReport(
             library_name="Movies",
             total_movies_scanned=100,
             movies_with_tmdb_id=95,
             movies_in_collections=50,
             unique_collections=10,
-            collections_with_gaps=[
-                CollectionGap(
-                    collection_id=1,
-                    collection_name="Incomplete",
-                    total_movies=5,
-                    owned_movies=3,
-                    missing_movies=[MissingMovie(tmdb_id=1, title="Movie 1")],
-                ),
-                CollectionGap(
-                    collection_id=2,
-                    collection_name="Disorganized",
-                    total_movies=3,
-                    owned_movies=3,
-                    missing_movies=[],
-                    is_complete=True,
-                ),
-            ],
+            collections_with_gaps=list(gaps),
         )
-        # 10 total - 1 incomplete = 9 complete (disorganized counts as complete)
-        assert report.complete_collections == 9
+        assert getattr(report, attr) == expected
 
     def test_movies_in_different_folders_same_grandparent(self) -> None:
         """Test movies in same grandparent directory are organized."""
@@ -354,42 +415,17 @@ class TestGapModels:
 class TestMovieGapFinder:
     """Tests for the MovieGapFinder class."""
 
-    def _create_mock_plex_client(self, movies: list[PlexMovie]) -> MagicMock:
-        """Create a mock Plex client."""
-        mock_client = MagicMock()
-        mock_client.get_movies.return_value = movies
-        mock_client.get_movie_libraries.return_value = [MagicMock(title="Movies")]
-        return mock_client
+    def _create_mock_plex_client(self, movies: list[PlexMovie]) -> FakePlex:
+        """Create a stub Plex client."""
+        return FakePlex(movies)
 
     def _create_mock_tmdb_client(
         self,
         movie_collections: dict[int, int | None],
         collections: dict[int, TMDBCollection],
-    ) -> MagicMock:
-        """Create a mock TMDB client."""
-        mock_client = MagicMock()
-
-        def get_movie(movie_id: int) -> TMDBMovieDetails:
-            collection_id = movie_collections.get(movie_id)
-            collection_info = None
-            if collection_id:
-                collection_info = {
-                    "id": collection_id,
-                    "name": f"Collection {collection_id}",
-                }
-            return TMDBMovieDetails(
-                id=movie_id,
-                title=f"Movie {movie_id}",
-                belongs_to_collection=collection_info,
-            )
-
-        def get_collection(collection_id: int) -> TMDBCollection:
-            return collections[collection_id]
-
-        mock_client.get_movie.side_effect = get_movie
-        mock_client.get_collection.side_effect = get_collection
-
-        return mock_client
+    ) -> FakeTMDB:
+        """Create a stub TMDB client."""
+        return FakeTMDB(movie_collections, collections)
 
     def test_find_gaps_empty_library(self) -> None:
         """Test with empty movie library."""
@@ -431,16 +467,7 @@ class TestMovieGapFinder:
 
         # Both movies belong to collection 1
         movie_collections = {100: 1, 101: 1}
-        collections = {
-            1: TMDBCollection(
-                id=1,
-                name="Complete Collection",
-                parts=[
-                    TMDBMovie(id=100, title="Movie 1", release_date=date(2020, 1, 1)),
-                    TMDBMovie(id=101, title="Movie 2", release_date=date(2021, 1, 1)),
-                ],
-            ),
-        }
+        collections = {1: TWO_MOVIE_COLLECTION}
         tmdb = self._create_mock_tmdb_client(movie_collections, collections)
 
         finder = MovieGapFinder(plex, tmdb)
@@ -457,17 +484,7 @@ class TestMovieGapFinder:
         plex = self._create_mock_plex_client(movies)
 
         movie_collections = {348: 8091}  # Alien Collection
-        collections = {
-            8091: TMDBCollection(
-                id=8091,
-                name="Alien Collection",
-                parts=[
-                    TMDBMovie(id=348, title="Alien", release_date=date(1979, 5, 25)),
-                    TMDBMovie(id=679, title="Aliens", release_date=date(1986, 7, 18)),
-                    TMDBMovie(id=8077, title="Alien 3", release_date=date(1992, 5, 22)),
-                ],
-            ),
-        }
+        collections = {8091: ALIEN_COLLECTION}
         tmdb = self._create_mock_tmdb_client(movie_collections, collections)
 
         finder = MovieGapFinder(plex, tmdb, min_owned=1)
@@ -481,59 +498,24 @@ class TestMovieGapFinder:
         assert gap.missing_count == 2
         assert {m.title for m in gap.missing_movies} == {"Aliens", "Alien 3"}
 
-    def test_find_gaps_excludes_future_releases(self) -> None:
-        """Test that future releases are excluded by default."""
+    @pytest.mark.parametrize(
+        ("include_future", "expected_missing"),
+        [(False, []), (True, ["Future Movie"])],
+    )
+    def test_find_gaps_future_flag(self, include_future: bool, expected_missing: list[str]) -> None:
+        """Test that future releases are only reported when include_future is set."""
         movies = [
             PlexMovie(rating_key="1", title="Released Movie", tmdb_id=100),
         ]
         plex = self._create_mock_plex_client(movies)
+        tmdb = self._create_mock_tmdb_client({100: 1}, {1: FUTURE_COLLECTION})
 
-        movie_collections = {100: 1}
-        collections = {
-            1: TMDBCollection(
-                id=1,
-                name="Test Collection",
-                parts=[
-                    TMDBMovie(id=100, title="Released Movie", release_date=date(2020, 1, 1)),
-                    TMDBMovie(id=101, title="Future Movie", release_date=date(2099, 12, 31)),
-                ],
-            ),
-        }
-        tmdb = self._create_mock_tmdb_client(movie_collections, collections)
-
-        finder = MovieGapFinder(plex, tmdb, include_future=False)
+        finder = MovieGapFinder(plex, tmdb, include_future=include_future, min_owned=1)
         report = finder.find_gaps()
 
-        # Collection should be complete (future movie excluded)
-        assert report.collections_with_gaps == []
-
-    def test_find_gaps_includes_future_when_enabled(self) -> None:
-        """Test that future releases are included when flag is set."""
-        movies = [
-            PlexMovie(rating_key="1", title="Released Movie", tmdb_id=100),
-        ]
-        plex = self._create_mock_plex_client(movies)
-
-        movie_collections = {100: 1}
-        collections = {
-            1: TMDBCollection(
-                id=1,
-                name="Test Collection",
-                parts=[
-                    TMDBMovie(id=100, title="Released Movie", release_date=date(2020, 1, 1)),
-                    TMDBMovie(id=101, title="Future Movie", release_date=date(2099, 12, 31)),
-                ],
-            ),
-        }
-        tmdb = self._create_mock_tmdb_client(movie_collections, collections)
-
-        finder = MovieGapFinder(plex, tmdb, include_future=True, min_owned=1)
-        report = finder.find_gaps()
-
-        assert len(report.collections_with_gaps) == 1
-        gap = report.collections_with_gaps[0]
-        assert gap.missing_count == 1
-        assert gap.missing_movies[0].title == "Future Movie"
+        # Without the future movie the collection is complete and not reported
+        missing = [m.title for gap in report.collections_with_gaps for m in gap.missing_movies]
+        assert missing == expected_missing
 
     def test_find_gaps_progress_callback(self) -> None:
         """Test that progress callback is called."""
@@ -581,16 +563,7 @@ class TestMovieGapFinder:
 
         # Collection with only 2 movies (1 owned, 1 missing)
         movie_collections = {100: 1}
-        collections = {
-            1: TMDBCollection(
-                id=1,
-                name="Small Collection",
-                parts=[
-                    TMDBMovie(id=100, title="Movie 1", release_date=date(2020, 1, 1)),
-                    TMDBMovie(id=101, title="Movie 2", release_date=date(2021, 1, 1)),
-                ],
-            ),
-        }
+        collections = {1: TWO_MOVIE_COLLECTION}
         tmdb = self._create_mock_tmdb_client(movie_collections, collections)
 
         # With min_collection_size=3, this collection should be skipped
@@ -608,17 +581,7 @@ class TestMovieGapFinder:
 
         # Collection with 3 movies
         movie_collections = {100: 1}
-        collections = {
-            1: TMDBCollection(
-                id=1,
-                name="Large Collection",
-                parts=[
-                    TMDBMovie(id=100, title="Movie 1", release_date=date(2020, 1, 1)),
-                    TMDBMovie(id=101, title="Movie 2", release_date=date(2021, 1, 1)),
-                    TMDBMovie(id=102, title="Movie 3", release_date=date(2022, 1, 1)),
-                ],
-            ),
-        }
+        collections = {1: THREE_MOVIE_COLLECTION}
         tmdb = self._create_mock_tmdb_client(movie_collections, collections)
 
         # With min_collection_size=3, this collection should be included
@@ -640,10 +603,7 @@ class TestMovieGapFinder:
             1: TMDBCollection(
                 id=1,
                 name="Skip This Collection",
-                parts=[
-                    TMDBMovie(id=100, title="Movie 1", release_date=date(2020, 1, 1)),
-                    TMDBMovie(id=101, title="Movie 2", release_date=date(2021, 1, 1)),
-                ],
+                parts=TWO_MOVIE_PARTS,
             ),
         }
         tmdb = self._create_mock_tmdb_client(movie_collections, collections)
@@ -669,10 +629,7 @@ class TestMovieGapFinder:
             1: TMDBCollection(
                 id=1,
                 name="The Collection",
-                parts=[
-                    TMDBMovie(id=100, title="Movie 1", release_date=date(2020, 1, 1)),
-                    TMDBMovie(id=101, title="Movie 2", release_date=date(2021, 1, 1)),
-                ],
+                parts=TWO_MOVIE_PARTS,
             ),
         }
         tmdb = self._create_mock_tmdb_client(movie_collections, collections)
@@ -695,17 +652,7 @@ class TestMovieGapFinder:
         plex = self._create_mock_plex_client(movies)
 
         movie_collections = {100: 1}
-        collections = {
-            1: TMDBCollection(
-                id=1,
-                name="Test Collection",
-                parts=[
-                    TMDBMovie(id=100, title="Movie 1", release_date=date(2020, 1, 1)),
-                    TMDBMovie(id=101, title="Movie 2", release_date=date(2021, 1, 1)),
-                    TMDBMovie(id=102, title="Movie 3", release_date=date(2022, 1, 1)),
-                ],
-            ),
-        }
+        collections = {1: THREE_MOVIE_COLLECTION}
         tmdb = self._create_mock_tmdb_client(movie_collections, collections)
 
         # With min_owned=2, collection should be filtered out (only owns 1)
@@ -729,17 +676,7 @@ class TestMovieGapFinder:
         plex = self._create_mock_plex_client(movies)
 
         movie_collections = {100: 1, 101: 1}
-        collections = {
-            1: TMDBCollection(
-                id=1,
-                name="Test Collection",
-                parts=[
-                    TMDBMovie(id=100, title="Movie 1", release_date=date(2020, 1, 1)),
-                    TMDBMovie(id=101, title="Movie 2", release_date=date(2021, 1, 1)),
-                    TMDBMovie(id=102, title="Movie 3", release_date=date(2022, 1, 1)),
-                ],
-            ),
-        }
+        collections = {1: THREE_MOVIE_COLLECTION}
         tmdb = self._create_mock_tmdb_client(movie_collections, collections)
 
         # With min_owned=2, collection should be included (owns 2)
@@ -759,17 +696,16 @@ class TestMovieGapFinder:
 
         # Movies 100-104 in collection 1, 105-109 in collection 2
         movie_collections = {100 + i: 1 if i < 5 else 2 for i in range(10)}
-        past = date(2020, 1, 1)
         collections = {
             1: TMDBCollection(
                 id=1,
                 name="Collection A",
                 parts=[
-                    TMDBMovie(id=100 + i, title=f"Movie {i}", release_date=past)
+                    TMDBMovie(id=100 + i, title=f"Movie {i}", release_date=PAST_DATE)
                     for i in range(5)  # 5 owned
                 ]
                 + [
-                    TMDBMovie(id=200 + i, title=f"Missing A{i}", release_date=past)
+                    TMDBMovie(id=200 + i, title=f"Missing A{i}", release_date=PAST_DATE)
                     for i in range(2)  # 2 missing (IDs 200, 201 not owned)
                 ],
             ),
@@ -777,11 +713,11 @@ class TestMovieGapFinder:
                 id=2,
                 name="Collection B",
                 parts=[
-                    TMDBMovie(id=105 + i, title=f"Movie {5 + i}", release_date=past)
+                    TMDBMovie(id=105 + i, title=f"Movie {5 + i}", release_date=PAST_DATE)
                     for i in range(5)  # 5 owned
                 ]
                 + [
-                    TMDBMovie(id=210 + i, title=f"Missing B{i}", release_date=past)
+                    TMDBMovie(id=210 + i, title=f"Missing B{i}", release_date=PAST_DATE)
                     for i in range(3)  # 3 missing (IDs 210-212 not owned)
                 ],
             ),
@@ -806,28 +742,22 @@ class TestMovieGapFinder:
 
         from complexionist.tmdb import TMDBNotFoundError
 
-        def get_movie(movie_id: int) -> TMDBMovieDetails:
-            if movie_id == 200:
-                raise TMDBNotFoundError("Not found")
-            collection_id = 1
-            return TMDBMovieDetails(
-                id=movie_id,
-                title=f"Movie {movie_id}",
-                belongs_to_collection={"id": collection_id, "name": "Col 1"},
-            )
+        class FlakyTMDB(FakeTMDB):
+            def get_movie_collection_id(self, movie_id: int) -> int | None:
+                if movie_id == 200:
+                    raise TMDBNotFoundError("Not found")
+                return super().get_movie_collection_id(movie_id)
 
-        tmdb = MagicMock()
-        tmdb.get_movie.side_effect = get_movie
-        past = date(2020, 1, 1)
-        tmdb.get_collection.return_value = TMDBCollection(
+        collection = TMDBCollection(
             id=1,
             name="Collection 1",
             parts=[
-                TMDBMovie(id=100, title="Good Movie", release_date=past),
-                TMDBMovie(id=300, title="Also Good", release_date=past),
-                TMDBMovie(id=400, title="Missing Movie", release_date=past),
+                TMDBMovie(id=100, title="Good Movie", release_date=PAST_DATE),
+                TMDBMovie(id=300, title="Also Good", release_date=PAST_DATE),
+                TMDBMovie(id=400, title="Missing Movie", release_date=PAST_DATE),
             ],
         )
+        tmdb = FlakyTMDB({100: 1, 300: 1}, {1: collection})
 
         finder = MovieGapFinder(plex, tmdb)
         report = finder.find_gaps()
@@ -851,7 +781,7 @@ class TestMovieGapFinder:
                 id=1,
                 name="Big Collection",
                 parts=[
-                    TMDBMovie(id=100 + i, title=f"Movie {i}", release_date=date(2020, 1, 1))
+                    TMDBMovie(id=100 + i, title=f"Movie {i}", release_date=PAST_DATE)
                     for i in range(25)  # 20 owned + 5 missing
                 ],
             ),
@@ -1098,7 +1028,7 @@ class TestEpisodeGapFinder:
         """Create a mock Plex client."""
         mock_client = MagicMock()
         mock_client.get_shows.return_value = shows
-        mock_client.get_tv_libraries.return_value = [MagicMock(title="TV Shows")]
+        mock_client.get_tv_libraries.return_value = _TV_LIBRARY_LIST
 
         def get_episodes(rating_key: str) -> list[PlexEpisode]:
             return episodes_by_show.get(rating_key, [])
@@ -4,7 +4,12 @@ from __future__ import annotations
 
 import json
 from datetime import date
+from pathlib import Path
 
+import pytest
+
+from complexionist import output as output_module
+from complexionist._console import get_console
 from complexionist.gaps.models import (
     CollectionGap,
     EpisodeGapReport,
@@ -153,6 +158,21 @@ class TestMovieReportJSON:
         assert result["total_missing"] == 0
         assert result["collections"] == []
 
+    def test_json_stdlib_fallback(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        formatter = MovieReportFormatter(_make_movie_report())
+        fast = formatter.to_json()
+        monkeypatch.setattr(output_module, "_HAS_ORJSON", False)
+        assert json.loads(formatter.to_json()) == json.loads(fast)
+        assert formatter.to_json(compact=True) == json.dumps(
+            json.loads(fast), separators=(",", ":")
+        )
+
+    def test_json_compact(self) -> None:
+        formatter = MovieReportFormatter(_make_movie_report())
+        compact = formatter.to_json(compact=True)
+        assert "\n" not in compact
+        assert json.loads(compact) == json.loads(formatter.to_json())
+
 
 class TestMovieReportCSV:
     """Tests for MovieReportFormatter.to_csv()."""
@@ -186,6 +206,40 @@ class TestMovieReportCSV:
         lines = csv_text.strip().splitlines()
         assert len(lines) == 1  # header only
 
+    def test_save_csv_streams_same_rows(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+        report = _make_movie_report()
+        formatter = MovieReportFormatter(report)
+        path = formatter.save_csv()
+        assert path.parent == tmp_path
+        with open(path, newline="", encoding="utf-8") as f:
+            assert f.read() == formatter.to_csv()
+
+    def test_save_csv_directory_and_date(self, tmp_path: Path) -> None:
+        formatter = MovieReportFormatter(_make_movie_report())
+        path = formatter.save_csv(tmp_path, date(2025, 1, 25))
+        assert path == tmp_path / "Movies_movie_gaps_2025-01-25.csv"
+        assert path.exists()
+
+        tv_path = TVReportFormatter(_make_tv_report()).save_csv(tmp_path, date(2025, 1, 25))
+        assert tv_path.name == "TV_Shows_tv_gaps_2025-01-25.csv"
+
+
+class TestMovieReportText:
+    """Tests for MovieReportFormatter.to_text()."""
+
+    def test_lists_each_missing_movie(self) -> None:
+        report = _make_movie_report()
+        formatter = MovieReportFormatter(report)
+        with get_console().capture() as capture:
+            formatter.to_text(verbose=True)
+        text = capture.get()
+        assert "  - Harry Potter and the Goblet of Fire (2005)\n" in text
+        assert "  - Harry Potter and the Order of the Phoenix (2007)\n" in text
+        assert "  - Alien Resurrection (1997)\n" in text
+
 
 class TestTVReportJSON:
     """Tests for TVReportFormatter.to_json()."""
@@ -251,6 +305,9 @@ class TestSanitizeFilename:
     def test_empty(self) -> None:
         assert MovieReportFormatter._sanitize_filename("") == ""
 
+    def test_unicode_letters_kept(self) -> None:
+        assert MovieReportFormatter._sanitize_filename("Filme für Kinder") == "Filme_für_Kinder"
+
 
 class TestScoreColor:
     """Tests for ReportFormatter._get_score_color()."""
@@ -230,6 +230,28 @@ class TestPlexClient:
         assert libraries[1].title == "TV Shows"
         assert libraries[1].is_tv_library is True
 
+    @patch("complexionist.plex.client.PlexServer")
+    def test_get_libraries_cached_per_connection(self, mock_server_class: MagicMock) -> None:
+        """Test library sections are fetched once until reconnecting."""
+        mock_section = MagicMock()
+        mock_section.key = 1
+        mock_section.title = "Movies"
+        mock_section.type = "movie"
+
+        mock_server = MagicMock()
+        mock_server.library.sections.return_value = [mock_section]
+        mock_server_class.return_value = mock_server
+
+        client = PlexClient(url="http://localhost:32400", token="test")
+        client.connect()
+        assert [lib.title for lib in client.get_movie_libraries()] == ["Movies"]
+        assert client.get_tv_libraries() == []
+        assert mock_server.library.sections.call_count == 1
+
+        client.connect()
+        client.get_libraries()
+        assert mock_server.library.sections.call_count == 2
+
     @patch("complexionist.plex.client.PlexServer")
     def test_extract_external_ids(self, mock_server_class: MagicMock) -> None:
         """Test extraction of external IDs from GUIDs."""
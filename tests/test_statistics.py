@@ -1,42 +1,79 @@
 """Tests for the statistics module."""
 
 import threading
-import time
+from collections.abc import Iterator
 from datetime import timedelta
 from io import StringIO
 
+import pytest
 from rich.console import Console
 
 from complexionist.statistics import PhaseStats, ScanStatistics
 
 
+class FakeClock:
+    """Manually advanced stand-in for the statistics clock."""
+
+    def __init__(self, start: float = 1_000_000.0) -> None:
+        self.current = start
+
+    def now(self) -> float:
+        return self.current
+
+    def advance(self, seconds: float) -> None:
+        self.current += seconds
+
+
+@pytest.fixture
+def fake_clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Replace the statistics module's clock with a FakeClock."""
+    clock = FakeClock()
+    monkeypatch.setattr("complexionist.statistics._now", clock.now)
+    return clock
+
+
+@pytest.fixture(autouse=True)
+def _reset_current_statistics() -> Iterator[None]:
+    """Keep the ScanStatistics singleton from leaking between tests."""
+    ScanStatistics.reset_current()
+    yield
+    ScanStatistics.reset_current()
+
+
+@pytest.fixture
+def silent_console() -> tuple[Console, StringIO]:
+    """Plain-text Console writing into a buffer."""
+    buffer = StringIO()
+    return Console(file=buffer, force_terminal=False, no_color=True, width=80), buffer
+
+
 class TestPhaseStats:
     """Tests for PhaseStats dataclass."""
 
-    def test_duration_while_running(self) -> None:
+    def test_duration_while_running(self, fake_clock: FakeClock) -> None:
         """Test duration calculation while phase is running."""
-        phase = PhaseStats(name="Test", started_at=time.time() - 1)
-        # Should be approximately 1 second
-        assert 0.9 < phase.duration_seconds < 1.5
+        phase = PhaseStats(name="Test", started_at=fake_clock.now())
+        fake_clock.advance(1.0)
+        assert phase.duration_seconds == 1.0
 
     def test_duration_after_ended(self) -> None:
         """Test duration calculation after phase has ended."""
-        start = time.time()
+        start = 1_000_000.0
         phase = PhaseStats(name="Test", started_at=start, ended_at=start + 2.5)
-        assert abs(phase.duration_seconds - 2.5) < 0.01
+        assert phase.duration_seconds == 2.5
 
 
 class TestScanStatistics:
     """Tests for ScanStatistics class."""
 
-    def test_start_and_stop(self) -> None:
+    def test_start_and_stop(self, fake_clock: FakeClock) -> None:
         """Test starting and stopping statistics."""
         stats = ScanStatistics()
         stats.start()
-        time.sleep(0.1)
+        fake_clock.advance(0.1)
         stats.stop()
 
-        assert stats.total_duration.total_seconds() >= 0.1
+        assert stats.duration_seconds == pytest.approx(0.1)
         assert ScanStatistics.get_current() is stats
 
     def test_get_current(self) -> None:
@@ -51,22 +88,48 @@ class TestScanStatistics:
         ScanStatistics.reset_current()
         assert ScanStatistics.get_current() is None
 
-    def test_record_api_calls(self) -> None:
-        """Test recording API calls."""
+    @pytest.mark.parametrize(
+        ("calls", "expected"),
+        [
+            (
+                [
+                    "tmdb_movie",
+                    "tmdb_movie",
+                    "tmdb_collection",
+                    "tvdb_series",
+                    "tvdb_episode",
+                    "tvdb_episode",
+                ],
+                {
+                    "tmdb_movie_requests": 2,
+                    "tmdb_collection_requests": 1,
+                    "tvdb_series_requests": 1,
+                    "tvdb_episode_requests": 2,
+                    "total_api_calls": 6,
+                },
+            ),
+            (
+                [],
+                {
+                    "tmdb_movie_requests": 0,
+                    "tmdb_collection_requests": 0,
+                    "tvdb_series_requests": 0,
+                    "tvdb_episode_requests": 0,
+                    "total_api_calls": 0,
+                },
+            ),
+        ],
+        ids=["mixed", "empty"],
+    )
+    def test_record_api_calls(self, calls: list[str], expected: dict[str, int]) -> None:
+        """Test recording API calls updates the per-type counters."""
         stats = ScanStatistics()
 
-        stats.record_api_call("tmdb_movie")
-        stats.record_api_call("tmdb_movie")
-        stats.record_api_call("tmdb_collection")
-        stats.record_api_call("tvdb_series")
-        stats.record_api_call("tvdb_episode")
-        stats.record_api_call("tvdb_episode")
+        for call_type in calls:
+            stats.record_api_call(call_type)
 
-        assert stats.tmdb_movie_requests == 2
-        assert stats.tmdb_collection_requests == 1
-        assert stats.tvdb_series_requests == 1
-        assert stats.tvdb_episode_requests == 2
-        assert stats.total_api_calls == 6
+        for attr, count in expected.items():
+            assert getattr(stats, attr) == count, attr
 
     def test_record_cache_hits_and_misses(self) -> None:
         """Test recording cache hits and misses."""
@@ -86,17 +149,17 @@ class TestScanStatistics:
         stats = ScanStatistics()
         assert stats.cache_hit_rate == 0.0
 
-    def test_phase_tracking(self) -> None:
+    def test_phase_tracking(self, fake_clock: FakeClock) -> None:
         """Test phase start and end."""
         stats = ScanStatistics()
         stats.start()
 
         stats.start_phase("Phase 1")
-        time.sleep(0.05)
+        fake_clock.advance(0.05)
         stats.end_phase(item_count=100)
 
         stats.start_phase("Phase 2")
-        time.sleep(0.05)
+        fake_clock.advance(0.25)
         stats.end_phase(item_count=50)
 
         stats.stop()
@@ -106,6 +169,8 @@ class TestScanStatistics:
         assert stats.phases[0].item_count == 100
         assert stats.phases[1].name == "Phase 2"
         assert stats.phases[1].item_count == 50
+        assert stats.phases[0].duration_seconds == pytest.approx(0.05)
+        assert stats.phases[1].duration_seconds == pytest.approx(0.25)
 
     def test_auto_end_phase_on_new_phase(self) -> None:
         """Test that starting a new phase ends the current one."""
@@ -119,7 +184,9 @@ class TestScanStatistics:
         assert stats.phases[0].name == "Phase 1"
         assert stats.phases[1].name == "Phase 2"
 
-    def test_print_summary(self) -> None:
+    def test_print_summary(
+        self, fake_clock: FakeClock, silent_console: tuple[Console, StringIO]
+    ) -> None:
         """Test printing summary to console."""
         stats = ScanStatistics()
         stats.start()
@@ -136,9 +203,7 @@ class TestScanStatistics:
 
         stats.stop()
 
-        # Capture output (no_color to avoid ANSI escape codes)
-        output = StringIO()
-        console = Console(file=output, force_terminal=False, no_color=True, width=80)
+        console, output = silent_console
         stats.print_summary(console)
 
         output_text = output.getvalue()
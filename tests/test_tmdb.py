@@ -1,10 +1,13 @@
 """Tests for the TMDB client."""
 
-from datetime import date
+from datetime import date, timedelta
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
+from complexionist.cache import Cache
 from complexionist.tmdb import (
     TMDBAuthError,
     TMDBClient,
@@ -110,6 +113,22 @@ class TestTMDBModels:
         assert len(released) == 1
         assert released[0].title == "Released"
 
+    def test_collection_released_movies_grace_period(self) -> None:
+        """Test released_movies applies the same 1-day grace period as is_released."""
+        today = date.today()
+        collection = TMDBCollection(
+            id=1,
+            name="Test Collection",
+            parts=[
+                TMDBMovie(id=1, title="Two days ago", release_date=today - timedelta(days=2)),
+                TMDBMovie(id=2, title="Yesterday", release_date=today - timedelta(days=1)),
+            ],
+        )
+
+        released = collection.released_movies
+        assert [m.title for m in released] == ["Two days ago"]
+        assert [m.is_released for m in collection.parts] == [True, False]
+
 
 class TestTMDBClient:
     """Tests for TMDB API client."""
@@ -128,10 +147,7 @@ class TestTMDBClient:
     @patch("httpx.Client.get")
     def test_get_movie_with_collection(self, mock_get: MagicMock) -> None:
         """Test getting a movie that belongs to a collection."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = MOVIE_RESPONSE
-        mock_get.return_value = mock_response
+        mock_get.return_value = httpx.Response(200, json=MOVIE_RESPONSE)
 
         with TMDBClient(api_key="test") as client:
             movie = client.get_movie(348)
@@ -146,10 +162,7 @@ class TestTMDBClient:
     @patch("httpx.Client.get")
     def test_get_movie_without_collection(self, mock_get: MagicMock) -> None:
         """Test getting a movie that doesn't belong to a collection."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = MOVIE_NO_COLLECTION_RESPONSE
-        mock_get.return_value = mock_response
+        mock_get.return_value = httpx.Response(200, json=MOVIE_NO_COLLECTION_RESPONSE)
 
         with TMDBClient(api_key="test") as client:
             movie = client.get_movie(550)
@@ -157,13 +170,22 @@ class TestTMDBClient:
         assert movie.collection_id is None
         assert movie.collection_name is None
 
+    @patch("httpx.Client.get")
+    def test_get_movie_collection_id_uses_cache(self, mock_get: MagicMock, tmp_path: Path) -> None:
+        """Test collection ID lookups are served from the cache after one fetch."""
+        mock_get.return_value = httpx.Response(200, json=MOVIE_RESPONSE)
+        cache = Cache(cache_dir=tmp_path)
+
+        with TMDBClient(api_key="test", cache=cache) as client:
+            assert client.get_movie_collection_id(348) == 8091
+            assert client.get_movie_collection_id(348) == 8091
+
+        assert mock_get.call_count == 1
+
     @patch("httpx.Client.get")
     def test_get_collection(self, mock_get: MagicMock) -> None:
         """Test getting a collection with all movies."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = COLLECTION_RESPONSE
-        mock_get.return_value = mock_response
+        mock_get.return_value = httpx.Response(200, json=COLLECTION_RESPONSE)
 
         with TMDBClient(api_key="test") as client:
             collection = client.get_collection(8091)
@@ -171,9 +193,25 @@ class TestTMDBClient:
         assert isinstance(collection, TMDBCollection)
         assert collection.id == 8091
         assert collection.name == "Alien Collection"
-        assert collection.movie_count == 3
+        assert len(collection.parts) == 3
         assert len(collection.released_movies) == 2  # Excludes future movie
 
+    @patch("httpx.Client.get")
+    def test_get_collection_blank_release_date(self, mock_get: MagicMock) -> None:
+        """Test that TMDB's empty release dates parse as None."""
+        data = {
+            "id": 1,
+            "name": "Test Collection",
+            "parts": [{"id": 2, "title": "Untitled Sequel", "release_date": ""}],
+        }
+        mock_get.return_value = httpx.Response(200, json=data)
+
+        with TMDBClient(api_key="test") as client:
+            collection = client.get_collection(1)
+
+        assert collection.parts[0].release_date is None
+        assert collection.released_movies == []
+
     @patch("httpx.Client.get")
     def test_handle_401_error(self, mock_get: MagicMock) -> None:
         """Test handling of 401 authentication error."""
@@ -0,0 +1,64 @@
+"""Tests for utility functions."""
+
+from unittest.mock import patch
+
+import pytest
+
+from complexionist.utils import retry_with_backoff
+
+
+class RateLimited(Exception):
+    """Test exception carrying a server-provided retry delay."""
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__("rate limited")
+        self.retry_after = retry_after
+
+
+class TestRetryWithBackoff:
+    """Tests for the retry_with_backoff decorator."""
+
+    def test_exponential_delays_without_jitter(self) -> None:
+        """Test delays double per attempt and the last failure is re-raised."""
+        calls = []
+
+        @retry_with_backoff(max_retries=3, base_delay=1.0, max_delay=3.0, jitter=0)
+        def always_fails() -> None:
+            calls.append(1)
+            raise ValueError("boom")
+
+        with patch("complexionist.utils.time.sleep") as sleep, pytest.raises(ValueError):
+            always_fails()
+
+        assert len(calls) == 4
+        assert [c.args[0] for c in sleep.call_args_list] == [1.0, 2.0, 3.0]
+
+    def test_jitter_stays_within_bounds(self) -> None:
+        """Test jittered delays fall between the base delay and base * (1 + jitter)."""
+
+        @retry_with_backoff(max_retries=2, base_delay=1.0, jitter=0.5)
+        def always_fails() -> None:
+            raise ValueError("boom")
+
+        with patch("complexionist.utils.time.sleep") as sleep, pytest.raises(ValueError):
+            always_fails()
+
+        first, second = (c.args[0] for c in sleep.call_args_list)
+        assert 1.0 <= first <= 1.5
+        assert 2.0 <= second <= 3.0
+
+    def test_retry_after_is_honored(self) -> None:
+        """Test a rate-limit retry_after longer than the backoff wins."""
+        attempts = []
+
+        @retry_with_backoff(max_retries=1, base_delay=1.0, jitter=0, retry_on=(RateLimited,))
+        def rate_limited_once() -> str:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RateLimited(retry_after=10)
+            return "ok"
+
+        with patch("complexionist.utils.time.sleep") as sleep:
+            assert rate_limited_once() == "ok"
+
+        sleep.assert_called_once_with(10)